@@ -1,7 +1,13 @@
-from .keyboard_controller import KeyboardController
-from .mouse_controller import MouseController
-from .window_manager import WindowManager
-from .notepad_controller import NotepadController
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package doesn't pull in pyautogui/pygetwindow up front.
+_LAZY_IMPORTS = {
+    'KeyboardController': ('automation.keyboard_controller', 'KeyboardController'),
+    'MouseController': ('automation.mouse_controller', 'MouseController'),
+    'WindowManager': ('automation.window_manager', 'WindowManager'),
+    'NotepadController': ('automation.notepad_controller', 'NotepadController'),
+}
 
 __all__ = [
     'KeyboardController',
@@ -9,3 +15,16 @@ __all__ = [
     'WindowManager',
     'NotepadController'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
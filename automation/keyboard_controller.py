@@ -1,12 +1,150 @@
 import pyautogui
 import pyperclip
+import ctypes
+import sys
 import time
 from typing import List
 import config
 from utils.logger import setup_logger
 
+try:
+    import win32clipboard
+    import pywintypes
+    WIN32CLIPBOARD_AVAILABLE = True
+except ImportError:
+    WIN32CLIPBOARD_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
+# Delays are managed explicitly at semantic boundaries, not after every primitive
+pyautogui.PAUSE = 0
+
+# Attempts to open the clipboard when another process holds it
+CLIPBOARD_OPEN_RETRIES = 3
+CLIPBOARD_RETRY_DELAY = 0.005
+
+# Characters per SendInput batch (each character is a key-down + key-up event)
+SEND_INPUT_CHUNK = 500
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+    
+    _user32 = ctypes.windll.user32
+    
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+    VK_RETURN = 0x0D
+    VK_TAB = 0x09
+    
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ('dx', wintypes.LONG),
+            ('dy', wintypes.LONG),
+            ('mouseData', wintypes.DWORD),
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t),
+        ]
+    
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ('wVk', wintypes.WORD),
+            ('wScan', wintypes.WORD),
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t),
+        ]
+    
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [
+            ('uMsg', wintypes.DWORD),
+            ('wParamL', wintypes.WORD),
+            ('wParamH', wintypes.WORD),
+        ]
+    
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [('mi', MOUSEINPUT), ('ki', KEYBDINPUT), ('hi', HARDWAREINPUT)]
+    
+    class INPUT(ctypes.Structure):
+        _anonymous_ = ('u',)
+        _fields_ = [('type', wintypes.DWORD), ('u', _INPUTUNION)]
+else:
+    _user32 = None
+
+
+def _set_clipboard(text: str):
+    """
+    Put text on the clipboard with a single OpenClipboard/CloseClipboard pair.
+    
+    Retries briefly if another process currently has the clipboard open.
+    """
+    for attempt in range(1, CLIPBOARD_OPEN_RETRIES + 1):
+        try:
+            win32clipboard.OpenClipboard()
+            break
+        except pywintypes.error:
+            if attempt == CLIPBOARD_OPEN_RETRIES:
+                raise
+            time.sleep(CLIPBOARD_RETRY_DELAY)
+    
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+def _build_key_events(text: str) -> list:
+    """
+    Convert text into (wVk, wScan, dwFlags) key events for SendInput.
+    
+    Newlines and tabs are sent as virtual keys; everything else is sent as
+    UTF-16 code units with KEYEVENTF_UNICODE.
+    """
+    events = []
+    text = text.replace('\r\n', '\n')
+    
+    for char in text:
+        if char == '\n' or char == '\t':
+            vk = VK_RETURN if char == '\n' else VK_TAB
+            events.append((vk, 0, 0))
+            events.append((vk, 0, KEYEVENTF_KEYUP))
+            continue
+        
+        encoded = char.encode('utf-16-le')
+        for i in range(0, len(encoded), 2):
+            code_unit = int.from_bytes(encoded[i:i + 2], 'little')
+            events.append((0, code_unit, KEYEVENTF_UNICODE))
+            events.append((0, code_unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    
+    return events
+
+
+def _send_text_input(text: str) -> bool:
+    """
+    Type text with batched SendInput calls (one syscall per chunk).
+    
+    Returns:
+        True if every event was accepted by the input queue
+    """
+    for start in range(0, len(text), SEND_INPUT_CHUNK):
+        events = _build_key_events(text[start:start + SEND_INPUT_CHUNK])
+        inputs = (INPUT * len(events))()
+        
+        for i, (vk, scan, flags) in enumerate(events):
+            inputs[i].type = INPUT_KEYBOARD
+            inputs[i].ki.wVk = vk
+            inputs[i].ki.wScan = scan
+            inputs[i].ki.dwFlags = flags
+        
+        sent = _user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+        if sent != len(events):
+            logger.error(f"SendInput accepted {sent}/{len(events)} events")
+            return False
+    
+    return True
+
 
 class KeyboardController:
     """Handles all keyboard operations for automation."""
@@ -25,6 +163,9 @@ class KeyboardController:
         """
         Type text.
         
+        On Windows, keystrokes are injected in batches via SendInput and
+        `interval` is not applied; elsewhere pyautogui types per character.
+        
         Args:
             text: Text to type
             interval: Delay between characters (None uses default)
@@ -40,6 +181,10 @@ class KeyboardController:
         
         try:
             logger.debug(f"Typing text: '{text[:50]}...' (length: {len(text)})")
+            
+            if _user32 is not None:
+                return _send_text_input(text)
+            
             pyautogui.write(text, interval=interval)
             return True
         except Exception as e:
@@ -58,8 +203,14 @@ class KeyboardController:
         """
         try:
             logger.debug(f"Pasting text (length: {len(text)})")
-            pyperclip.copy(text)
-            time.sleep(0.1)  # Small delay for clipboard
+            
+            if WIN32CLIPBOARD_AVAILABLE:
+                # Data is committed by CloseClipboard, no settle delay needed
+                _set_clipboard(text)
+            else:
+                pyperclip.copy(text)
+                time.sleep(0.02)  # Small delay for clipboard
+            
             pyautogui.hotkey('ctrl', 'v')
             return True
         except Exception as e:
@@ -73,11 +224,14 @@ class KeyboardController:
         Args:
             key: Key name (e.g., 'enter', 'esc', 'tab')
             presses: Number of times to press
-            interval: Delay between presses
+            interval: Delay between presses (ignored for a single press)
         
         Returns:
             True if key press was successful
         """
+        if presses == 1:
+            interval = 0
+        
         try:
             logger.debug(f"Pressing key: {key} (x{presses})")
             pyautogui.press(key, presses=presses, interval=interval)
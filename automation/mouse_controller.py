@@ -1,41 +1,91 @@
 import pyautogui
+import ctypes
+import sys
 import time
 import config
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Delays are managed explicitly at semantic boundaries, not after every primitive
+pyautogui.PAUSE = 0
+
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+
+_user32 = ctypes.windll.user32 if sys.platform == "win32" else None
+
+
+class _POINT(ctypes.Structure):
+    """Win32 POINT, reused across calls to avoid per-move marshalling."""
+    _fields_ = [('x', ctypes.c_long), ('y', ctypes.c_long)]
+
+
 class MouseController:
     """Handles all mouse operations for automation."""
     
     def __init__(self):
         """Initialize mouse controller."""
+        self._pt = _POINT()
         logger.info("Mouse controller initialized")
+    
+    def move_to(self, x: int, y: int, duration: float = 0) -> bool:
+        """
+        Move mouse to coordinates.
         
-    def move_to(self, x: int, y: int, duration: float = 0.5) -> bool:
-        """Move mouse to coordinates."""
+        With duration=0 on Windows the cursor is placed directly via
+        SetCursorPos; a positive duration animates the move with pyautogui.
+        """
         try:
-            pyautogui.moveTo(x, y, duration=duration)
+            if duration == 0 and _user32 is not None:
+                self._pt.x = int(x)
+                self._pt.y = int(y)
+                if not _user32.SetCursorPos(self._pt.x, self._pt.y):
+                    raise OSError("SetCursorPos failed")
+            else:
+                pyautogui.moveTo(x, y, duration=duration)
             return True
         except Exception as e:
             logger.error(f"Failed to move mouse: {e}")
             return False
-
+    
+    def get_position(self) -> tuple:
+        """Get current cursor position as (x, y)."""
+        if _user32 is not None and _user32.GetCursorPos(ctypes.byref(self._pt)):
+            return self._pt.x, self._pt.y
+        position = pyautogui.position()
+        return position.x, position.y
+    
+    def _left_click(self):
+        """Send a left button down/up at the current cursor position."""
+        _user32.mouse_event(MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
+        _user32.mouse_event(MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+    
     def click(self, x: int, y: int) -> bool:
         """Click at coordinates."""
         try:
-            self.move_to(x, y)
-            pyautogui.click(x, y)
+            if not self.move_to(x, y):
+                return False
+            if _user32 is not None:
+                self._left_click()
+            else:
+                pyautogui.click(x, y)
             return True
         except Exception as e:
             logger.error(f"Failed to click: {e}")
             return False
-
+    
     def double_click(self, x: int, y: int) -> bool:
         """Double click at coordinates."""
         try:
-            self.move_to(x, y)
-            pyautogui.doubleClick(x, y)
+            if not self.move_to(x, y):
+                return False
+            if _user32 is not None:
+                self._left_click()
+                time.sleep(config.DOUBLE_CLICK_GAP)
+                self._left_click()
+            else:
+                pyautogui.doubleClick(x, y)
             return True
         except Exception as e:
             logger.error(f"Failed to double click: {e}")
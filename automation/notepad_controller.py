@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Tuple
 import config
 from utils.logger import setup_logger
 from utils.retry import retry_on_exception
@@ -10,6 +10,26 @@ from automation.window_manager import WindowManager
 
 logger = setup_logger(__name__)
 
+# Fallback settle time when the OS can't report that Notepad is ready
+LAUNCH_SETTLE_DELAY = 0.5
+
+
+def _poll_until(condition: Callable[[], bool], timeout: float, interval: float) -> bool:
+    """
+    Poll a condition until it is true or the timeout expires.
+    
+    Returns:
+        True if the condition was met within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    
+    while True:
+        if condition():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
 
 class NotepadController:
     """High-level controller for Notepad automation."""
@@ -20,6 +40,16 @@ class NotepadController:
         self.keyboard = KeyboardController()
         self.window_manager = WindowManager()
         
+        # Snapshot timings once instead of resolving config attributes per call
+        self._type_delay = config.CFG.type_delay
+        self._keyboard_settle = config.CFG.keyboard_settle
+        self._save_dialog_wait = config.CFG.save_dialog_wait
+        self._post_save_delay = config.CFG.post_save_delay
+        self._post_close_delay = config.CFG.post_close_delay
+        self._window_wait_timeout = config.CFG.window_wait_timeout
+        self._input_idle_timeout = config.CFG.input_idle_timeout
+        self._dialog_poll_interval = config.CFG.dialog_poll_interval
+        
         logger.info("Notepad controller initialized")
     
     @retry_on_exception(max_attempts=3, delay=1)
@@ -45,15 +75,16 @@ class NotepadController:
         # Wait for Notepad window to appear
         logger.debug("Waiting for Notepad window...")
         window = self.window_manager.wait_for_window(
-            "Notepad",
-            timeout=config.WINDOW_WAIT_TIMEOUT
+            config.NOTEPAD_TITLE_RE,
+            timeout=self._window_wait_timeout
         )
         
         if not window:
             raise RuntimeError("Notepad window did not appear")
         
-        # Activate the window
-        time.sleep(0.5)
+        # Wait until Notepad is ready for input, then activate it
+        if not self.window_manager.wait_for_input_idle(window, self._input_idle_timeout):
+            time.sleep(LAUNCH_SETTLE_DELAY)
         self.window_manager.activate_window(window)
         
         logger.info("✓ Notepad launched successfully")
@@ -75,7 +106,7 @@ class NotepadController:
         success = self.keyboard.paste_text(content)
         
         if success:
-            time.sleep(config.TYPE_DELAY * 5)  # Give time for large text
+            time.sleep(self._type_delay * 5)  # Give time for large text
             logger.info("✓ Content written successfully")
         else:
             logger.error("✗ Failed to write content")
@@ -99,21 +130,39 @@ class NotepadController:
             logger.error("Failed to open Save dialog")
             return False
         
-        time.sleep(config.SAVE_DIALOG_WAIT)
+        dialog_open = _poll_until(
+            lambda: self.window_manager.find_window(config.SAVE_DIALOG_TITLE) is not None,
+            timeout=self._save_dialog_wait,
+            interval=self._dialog_poll_interval
+        )
+        
+        if not dialog_open:
+            logger.warning(f"'{config.SAVE_DIALOG_TITLE}' dialog not detected, typing path anyway")
         
         # Type the full filepath
         if not self.keyboard.paste_text(str(filepath)):
             logger.error("Failed to enter filepath")
             return False
         
-        time.sleep(0.5)
+        time.sleep(self._keyboard_settle)
         
         # Press Enter to save
         if not self.keyboard.press_key('enter'):
             logger.error("Failed to press Enter")
             return False
         
-        time.sleep(config.POST_SAVE_DELAY)
+        # Notepad retitles the window once the save has completed
+        saved_title = f"{filepath.name} - Notepad"
+        saved = _poll_until(
+            lambda: self.window_manager.find_window(saved_title) is not None,
+            timeout=self._post_save_delay,
+            interval=self._dialog_poll_interval
+        )
+        
+        if not saved:
+            logger.error(f"'{saved_title}' window not seen after {self._post_save_delay}s")
+            return False
+        
         logger.info("✓ File saved")
         return True
     
@@ -137,7 +186,7 @@ class NotepadController:
             logger.info("Closing Notepad windows")
             count = self.window_manager.close_windows_by_title("Notepad")
         
-        time.sleep(config.POST_CLOSE_DELAY)
+        time.sleep(self._post_close_delay)
         
         if count > 0:
             logger.info(f"✓ Closed {count} Notepad window(s)")
@@ -1,54 +1,163 @@
 import pygetwindow as gw
+import ctypes
+import sys
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import config
 from utils.logger import setup_logger
-from utils.validators import wait_for_window, find_window_by_title
+from utils.validators import (
+    TitlePattern,
+    wait_for_window,
+    find_window_by_title,
+    invalidate_window_cache
+)
 
 logger = setup_logger(__name__)
 
+# Direct user32 access for cheap handle checks (Windows only)
+_user32 = ctypes.windll.user32 if sys.platform == "win32" else None
+
+_kernel32 = ctypes.windll.kernel32 if sys.platform == "win32" else None
+
+if _kernel32 is not None:
+    from ctypes import wintypes
+    
+    _kernel32.OpenProcess.restype = ctypes.c_void_p
+    # DWORD result so WAIT_FAILED compares as 0xFFFFFFFF rather than -1
+    _user32.WaitForInputIdle.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+    _user32.WaitForInputIdle.restype = wintypes.DWORD
+
+WM_CLOSE = 0x0010
+PROCESS_TERMINATE = 0x0001
+SYNCHRONIZE = 0x00100000
+PROCESS_QUERY_INFORMATION = 0x0400
+WAIT_FAILED = 0xFFFFFFFF
+CLOSE_WAIT_POLLS = 20
+CLOSE_WAIT_INTERVAL = 0.05
+
 
 class WindowManager:
     """Manages window operations - finding, activating, closing."""
     
-    def __init__(self, activation_delay: float = None):
+    def __init__(self, activation_delay: float = None, cache_ttl: float = None):
         """
         Initialize window manager.
         
         Args:
             activation_delay: Delay after activating windows
+            cache_ttl: How long (seconds) a found window is reused before re-enumerating
         """
-        self.activation_delay = activation_delay or config.WINDOW_ACTIVATION_DELAY
+        self.activation_delay = activation_delay or config.CFG.window_activation_delay
+        self.cache_ttl = cache_ttl if cache_ttl is not None else config.WINDOW_CACHE_TTL
+        
+        # (title_pattern, exact_match) -> (timestamp, window)
+        self._hwnd_cache: Dict[Tuple[TitlePattern, bool], Tuple[float, gw.Win32Window]] = {}
+        
         logger.info("Window manager initialized")
     
+    @staticmethod
+    def _is_handle_valid(window: gw.Win32Window) -> bool:
+        """Check that a window handle still exists without enumerating all windows."""
+        if _user32 is None:
+            return True
+        return bool(_user32.IsWindow(window._hWnd))
+    
+    def invalidate(self, window: gw.Win32Window = None):
+        """
+        Drop cached window lookups.
+        
+        Args:
+            window: Only drop entries pointing at this window (None = clear all)
+        """
+        if window is None:
+            self._hwnd_cache.clear()
+            invalidate_window_cache()
+            return
+        
+        stale = [
+            key for key, (_, cached) in self._hwnd_cache.items()
+            if cached._hWnd == window._hWnd
+        ]
+        for key in stale:
+            del self._hwnd_cache[key]
+    
     def find_window(
         self,
-        title_pattern: str,
+        title_pattern: TitlePattern,
         exact_match: bool = False
     ) -> Optional[gw.Win32Window]:
         """
         Find a window by title.
         
+        Recent hits are served from a short-lived cache so repeated lookups
+        don't re-enumerate every top-level window.
+        
         Args:
-            title_pattern: Window title or pattern
+            title_pattern: Window title, or a compiled regex
             exact_match: Require exact match
         
         Returns:
             Window object if found
         """
-        return find_window_by_title(title_pattern, exact_match, timeout=0)
+        key = (title_pattern, exact_match)
+        cached = self._hwnd_cache.get(key)
+        
+        if cached:
+            timestamp, window = cached
+            if time.monotonic() - timestamp < self.cache_ttl and self._is_handle_valid(window):
+                return window
+            del self._hwnd_cache[key]
+        
+        window = None
+        if exact_match and isinstance(title_pattern, str):
+            window = self._find_exact_window(title_pattern)
+        
+        if window is None:
+            window = find_window_by_title(title_pattern, exact_match, timeout=0)
+        
+        if window:
+            self._hwnd_cache[key] = (time.monotonic(), window)
+        
+        return window
+    
+    @staticmethod
+    def _find_exact_window(title: str) -> Optional[gw.Win32Window]:
+        """
+        Look up a top-level window by exact title with FindWindowW.
+        
+        Skips enumerating every window. Returns None when unsupported or not
+        found, so callers can fall back to enumeration.
+        """
+        if _user32 is None:
+            return None
+        
+        hwnd = _user32.FindWindowW(None, title)
+        
+        # FindWindowW ignores case and visibility; enumeration does not
+        if not hwnd or not _user32.IsWindowVisible(hwnd):
+            return None
+        
+        window = gw.Win32Window(hwnd)
+        if window.title != title:
+            return None
+        
+        logger.debug(f"Found window via FindWindowW: {title}")
+        return window
     
     def wait_for_window(
         self,
-        title_pattern: str,
+        title_pattern: TitlePattern,
         timeout: float = None,
         exact_match: bool = False
     ) -> Optional[gw.Win32Window]:
         """
         Wait for a window to appear.
         
+        A compiled regex (e.g. config.NOTEPAD_TITLE_RE) lets one wait cover
+        several alternative titles in a single pass over the windows.
+        
         Args:
-            title_pattern: Window title pattern
+            title_pattern: Window title pattern, or a compiled regex
             timeout: Max time to wait
             exact_match: Require exact match
         
@@ -56,7 +165,17 @@ class WindowManager:
             Window object if found within timeout
         """
         timeout = timeout or config.WINDOW_WAIT_TIMEOUT
-        return wait_for_window(title_pattern, timeout, exact_match)
+        
+        window = self.find_window(title_pattern, exact_match)
+        if window:
+            return window
+        
+        window = wait_for_window(title_pattern, timeout, exact_match)
+        
+        if window:
+            self._hwnd_cache[(title_pattern, exact_match)] = (time.monotonic(), window)
+        
+        return window
     
     def activate_window(self, window: gw.Win32Window) -> bool:
         """
@@ -81,6 +200,81 @@ class WindowManager:
             logger.error(f"Failed to activate window: {e}")
             return False
     
+    def get_window_pid(self, window: gw.Win32Window) -> Optional[int]:
+        """
+        Get the process ID that owns a window.
+        
+        Args:
+            window: Window to inspect
+        
+        Returns:
+            Process ID, or None if unavailable
+        """
+        if not window or _user32 is None:
+            return None
+        
+        pid = ctypes.c_ulong(0)
+        _user32.GetWindowThreadProcessId(window._hWnd, ctypes.byref(pid))
+        return pid.value or None
+    
+    def wait_for_input_idle(self, window: gw.Win32Window, timeout: float) -> bool:
+        """
+        Block until the window's process is waiting for user input.
+        
+        Args:
+            window: Window whose owning process to wait on
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if the process became idle, False if unsupported, failed or timed out
+        """
+        pid = self.get_window_pid(window)
+        if pid is None:
+            return False
+        
+        handle = _kernel32.OpenProcess(SYNCHRONIZE | PROCESS_QUERY_INFORMATION, False, pid)
+        if not handle:
+            logger.debug(f"Could not open process {pid} to wait for input idle")
+            return False
+        
+        try:
+            result = _user32.WaitForInputIdle(ctypes.c_void_p(handle), int(timeout * 1000))
+        finally:
+            _kernel32.CloseHandle(ctypes.c_void_p(handle))
+        
+        if result == 0:
+            logger.debug(f"Process {pid} is idle")
+            return True
+        
+        if result == WAIT_FAILED:
+            logger.debug(f"WaitForInputIdle failed for process {pid}")
+        else:
+            logger.debug(f"Process {pid} not idle after {timeout}s")
+        return False
+    
+    def _terminate_process(self, window: gw.Win32Window):
+        """
+        Terminate the process that owns a window, in-process via TerminateProcess.
+        
+        Raises:
+            OSError: If the process can't be resolved, opened or terminated
+        """
+        pid = self.get_window_pid(window)
+        if pid is None:
+            raise OSError(f"Could not resolve process for window: {window.title}")
+        
+        handle = _kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            raise OSError(f"Could not open process {pid} for termination")
+        
+        try:
+            if not _kernel32.TerminateProcess(ctypes.c_void_p(handle), 1):
+                raise OSError(f"TerminateProcess failed for process {pid}")
+        finally:
+            _kernel32.CloseHandle(ctypes.c_void_p(handle))
+        
+        logger.debug(f"Terminated process {pid}")
+    
     def close_window(self, window: gw.Win32Window, force: bool = False) -> bool:
         """
         Close a window.
@@ -100,14 +294,13 @@ class WindowManager:
             logger.info(f"Closing window: {window.title}")
             
             if force:
-                # Force close by killing process (more aggressive)
-                import subprocess
-                subprocess.run(['taskkill', '/F', '/PID', str(window._hWnd)], 
-                             capture_output=True)
+                # Force close by killing the owning process (more aggressive)
+                self._terminate_process(window)
             else:
                 # Normal close
                 window.close()
             
+            self.invalidate(window)
             return True
         except Exception as e:
             logger.error(f"Failed to close window: {e}")
@@ -121,6 +314,9 @@ class WindowManager:
         """
         Close all windows matching title pattern.
         
+        On Windows, WM_CLOSE is posted to every match in one pass (no
+        activation), then we briefly wait for the handles to go away.
+        
         Args:
             title_pattern: Window title pattern
             close_all: If True, close all matches; otherwise just first
@@ -129,6 +325,41 @@ class WindowManager:
             Number of windows closed
         """
         windows = gw.getWindowsWithTitle(title_pattern)
+        
+        if not close_all:
+            windows = windows[:1]
+        
+        if _user32 is not None:
+            closed_count = self._post_close(windows)
+        else:
+            closed_count = self._close_sequentially(windows)
+        
+        if closed_count > 0:
+            self.invalidate()
+            logger.info(f"Closed {closed_count} window(s) matching '{title_pattern}'")
+        
+        return closed_count
+    
+    def _post_close(self, windows: List[gw.Win32Window]) -> int:
+        """Post WM_CLOSE to each window and wait (bounded) for them to close."""
+        hwnds = []
+        
+        for window in windows:
+            if _user32.PostMessageW(window._hWnd, WM_CLOSE, 0, 0):
+                hwnds.append(window._hWnd)
+                logger.debug(f"Posted WM_CLOSE: {window.title}")
+            else:
+                logger.warning(f"Failed to post WM_CLOSE to {window.title}")
+        
+        for _ in range(CLOSE_WAIT_POLLS):
+            if not any(_user32.IsWindow(hwnd) for hwnd in hwnds):
+                break
+            time.sleep(CLOSE_WAIT_INTERVAL)
+        
+        return len(hwnds)
+    
+    def _close_sequentially(self, windows: List[gw.Win32Window]) -> int:
+        """Activate and close each window in turn (portable fallback)."""
         closed_count = 0
         
         for window in windows:
@@ -138,15 +369,9 @@ class WindowManager:
                 window.close()
                 closed_count += 1
                 logger.debug(f"Closed: {window.title}")
-                
-                if not close_all:
-                    break
             except Exception as e:
                 logger.warning(f"Failed to close {window.title}: {e}")
         
-        if closed_count > 0:
-            logger.info(f"Closed {closed_count} window(s) matching '{title_pattern}'")
-        
         return closed_count
     
     def get_all_windows(self) -> List[gw.Win32Window]:
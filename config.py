@@ -1,4 +1,7 @@
 import os 
+import re
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -26,26 +29,67 @@ TEMPLATE_PATH = RESOURCES_DIR / "notepad_icon.png"
 # API Configuration
 API_URL = "https://jsonplaceholder.typicode.com/posts"
 API_TIMEOUT = 5
+API_MAX_RETRIES = 2
+API_RETRY_BACKOFF = 0.3
+API_POOL_SIZE = 4
+API_CACHE_PATH = PROJECT_ROOT / ".api_cache"
+API_CACHE_EXPIRE = 3600
 POSTS_COUNT = 10
 
 # Grounding Configuration
 TEMPLATE_MATCH_THRESHOLD = 0.7  
+TEMPLATE_USE_FFT = True  # FFT-based NCC on the screenshot instead of BotCity's find
+TEMPLATE_PYRAMID_LEVELS = 3  # Downsampled levels for coarse-to-fine search (0 = off)
+TEMPLATE_USE_CUDA = True  # Exhaustive conv2d NCC on the GPU when torch sees CUDA
+PRESCREEN_ENABLED = False  # Sparse random-pixel prescreen before the template search
+SAD_PRESCREEN_ENABLED = False  # Decimated difference prescreen before the pyramid search
 OCR_CONFIDENCE_THRESHOLD = 0.6
+OCR_MAX_DIM = 1920  # Longest screenshot side fed to OCR; larger images are downscaled
 MAX_GROUNDING_ATTEMPTS = 3
 GROUNDING_RETRY_DELAY = 1  
+FORCE_REGROUND = False  # Ground the icon for every post even if the desktop is unchanged
+ICON_CACHE_DIFF_THRESHOLD = 2.0  # Max mean abs diff (0-255) of the patch around the cached icon
+PIPELINE_CAPTURE = False  # Ground the next post's icon in the background after each save
 
 # Window Configuration
 NOTEPAD_WINDOW_TITLES = ["Untitled - Notepad", "Notepad"]
+NOTEPAD_TITLE_RE = re.compile(
+    "^(?:" + "|".join(map(re.escape, NOTEPAD_WINDOW_TITLES)) + ")$"
+)
 WINDOW_WAIT_TIMEOUT = 5  
 WINDOW_ACTIVATION_DELAY = 0.5
+WINDOW_CACHE_TTL = 0.2
+SAVE_DIALOG_TITLE = "Save as"
 
 # Automation Timings
 STARTUP_DELAY = 5  
 DOUBLE_CLICK_INTERVAL = 0.3
+DOUBLE_CLICK_GAP = 0.05  # Between the two clicks of a double-click (well under GetDoubleClickTime)
 TYPE_DELAY = 0.1
+KEYBOARD_SETTLE = 0.1
 SAVE_DIALOG_WAIT = 2
 POST_SAVE_DELAY = 1.5
 POST_CLOSE_DELAY = 1
+INPUT_IDLE_TIMEOUT = 2
+DIALOG_POLL_INTERVAL = 0.02
+
+
+# Immutable snapshot of the timings used on automation hot paths.
+# Slots are only available on dataclasses from Python 3.10.
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
+class Config:
+    type_delay: float = TYPE_DELAY
+    keyboard_settle: float = KEYBOARD_SETTLE
+    save_dialog_wait: float = SAVE_DIALOG_WAIT
+    post_save_delay: float = POST_SAVE_DELAY
+    post_close_delay: float = POST_CLOSE_DELAY
+    window_wait_timeout: float = WINDOW_WAIT_TIMEOUT
+    window_activation_delay: float = WINDOW_ACTIVATION_DELAY
+    input_idle_timeout: float = INPUT_IDLE_TIMEOUT
+    dialog_poll_interval: float = DIALOG_POLL_INTERVAL
+
+
+CFG = Config()
 
 # Logging Configuration
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -55,6 +99,7 @@ LOG_LEVEL = 'INFO'
 SAVE_DEBUG_SCREENSHOTS = True
 DEBUG_MARKER_COLOR = "red"
 DEBUG_MARKER_RADIUS = 15
+DEBUG_IMAGE_FORMAT = 'JPEG'  # 'JPEG', 'WEBP' or 'PNG'
 
 def ensure_directories():
     """Create necessary directories if they don't exist."""
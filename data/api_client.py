@@ -1,13 +1,34 @@
 import requests
+import ctypes
+import itertools
 import json
+import os
+import shutil
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 from utils.logger import setup_logger
-from utils.retry import retry_on_exception
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = setup_logger(__name__)
 
+REQUIRED_POST_FIELDS = ('id', 'title', 'body')
+
 
 class PostAPIClient:
     """
@@ -15,25 +36,53 @@ class PostAPIClient:
     Falls back to local data if API is unavailable.
     """
     
-    def __init__(self, api_url: str = None, timeout: int = None):
+    def __init__(self, api_url: str = None, timeout: int = None, use_cache: bool = True):
         """
         Initialize API client.
         
         Args:
             api_url: API endpoint URL
             timeout: Request timeout in seconds
+            use_cache: Cache responses on disk and revalidate with ETag/Last-Modified
         """
         self.api_url = api_url or config.API_URL
         self.timeout = timeout or config.API_TIMEOUT
         self.fallback_data_path = Path(__file__).parent / "fallback_data.json"
         
+        if use_cache and REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession(
+                cache_name=str(config.API_CACHE_PATH),
+                backend='sqlite',
+                expire_after=config.API_CACHE_EXPIRE,
+                cache_control=True
+            )
+            logger.debug(f"HTTP cache enabled: {config.API_CACHE_PATH}")
+        else:
+            if use_cache:
+                logger.warning("requests-cache not installed, HTTP caching disabled")
+            self.session = requests.Session()
+        
+        # Keep-alive pool; retries happen inside urllib3 and reuse the connection
+        adapter = HTTPAdapter(
+            pool_connections=config.API_POOL_SIZE,
+            pool_maxsize=config.API_POOL_SIZE,
+            max_retries=Retry(
+                total=config.API_MAX_RETRIES,
+                backoff_factor=config.API_RETRY_BACKOFF,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         logger.info(f"API Client initialized: {self.api_url}")
     
-    @retry_on_exception(max_attempts=2, delay=1, exceptions=(requests.RequestException,))
     def fetch_posts(self, count: int = None) -> List[Dict]:
         """
         Fetch blog posts from API.
         
+        Transient failures are retried by the session's HTTPAdapter.
+        
         Args:
             count: Number of posts to fetch
         
@@ -45,17 +94,21 @@ class PostAPIClient:
         logger.info(f"Fetching {count} posts from API...")
         
         try:
-            response = requests.get(self.api_url, timeout=self.timeout)
+            response = self.session.get(self.api_url, timeout=self.timeout)
             response.raise_for_status()
             
-            posts = response.json()[:count]
-            logger.info(f"✓ Successfully fetched {len(posts)} posts from API")
+            posts = list(itertools.islice(self.iter_valid(response.json()), count))
+            
+            if getattr(response, 'from_cache', False):
+                logger.info(f"✓ Loaded {len(posts)} posts from HTTP cache")
+            else:
+                logger.info(f"✓ Successfully fetched {len(posts)} posts from API")
             
             return posts
             
         except requests.RequestException as e:
             logger.warning(f"API request failed: {e}")
-            raise  # Let retry decorator handle it
+            raise  # Caller falls back to local data
     
     def fetch_posts_with_fallback(self, count: int = None) -> List[Dict]:
         """
@@ -76,10 +129,31 @@ class PostAPIClient:
             logger.info("Falling back to local data...")
             return self.load_fallback_data(count)
     
+    def fetch_posts_async(self, count: int = None) -> Future:
+        """
+        Start fetching posts (with fallback) on a background thread.
+        
+        Lets network I/O overlap with other work; call `.result()` on the
+        returned future when the posts are needed.
+        
+        Args:
+            count: Number of posts to fetch
+        
+        Returns:
+            Future resolving to a list of post dictionaries
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="post-fetch")
+        future = executor.submit(self.fetch_posts_with_fallback, count)
+        executor.shutdown(wait=False)
+        return future
+    
     def load_fallback_data(self, count: int = None) -> List[Dict]:
         """
         Load posts from local fallback JSON file.
         
+        With ijson installed the file is stream-parsed and reading stops
+        after `count` valid posts instead of parsing the whole array.
+        
         Args:
             count: Number of posts to load
         
@@ -94,8 +168,14 @@ class PostAPIClient:
         
         logger.info(f"Loading fallback data from: {self.fallback_data_path}")
         
-        with open(self.fallback_data_path, 'r', encoding='utf-8') as f:
-            posts = json.load(f)[:count]
+        if IJSON_AVAILABLE:
+            with open(self.fallback_data_path, 'rb') as f:
+                items = ijson.items(f, 'item', use_float=True)
+                posts = list(itertools.islice(self.iter_valid(items), count))
+        else:
+            with open(self.fallback_data_path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+            posts = list(itertools.islice(self.iter_valid(items), count))
         
         logger.info(f"✓ Loaded {len(posts)} posts from fallback data")
         return posts
@@ -110,15 +190,32 @@ class PostAPIClient:
         Returns:
             True if post is valid
         """
-        required_fields = ['id', 'title', 'body']
-        
-        for field in required_fields:
+        for field in REQUIRED_POST_FIELDS:
             if field not in post:
                 logger.warning(f"Post missing required field: {field}")
                 return False
         
         return True
     
+    def iter_valid(self, posts: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Lazily yield only posts that have all required fields.
+        
+        Combined with itertools.islice this validates and limits in a
+        single pass, so an invalid post doesn't shrink the batch.
+        
+        Args:
+            posts: Iterable of post dictionaries
+        
+        Yields:
+            Valid posts, in order
+        """
+        for post in posts:
+            if all(field in post for field in REQUIRED_POST_FIELDS):
+                yield post
+            else:
+                self.validate_post(post)  # Logs which field is missing
+    
     def validate_posts(self, posts: List[Dict]) -> List[Dict]:
         """
         Filter posts to only valid ones.
@@ -129,7 +226,7 @@ class PostAPIClient:
         Returns:
             List of valid posts
         """
-        valid_posts = [post for post in posts if self.validate_post(post)]
+        valid_posts = list(self.iter_valid(posts))
         
         if len(valid_posts) < len(posts):
             logger.warning(
@@ -161,6 +258,52 @@ class PostAPIClient:
             Filename string
         """
         return f"post_{post['id']}.txt"
+    
+    def prepare_batch(self, posts: List[Dict]) -> Tuple[List[str], List[str]]:
+        """
+        Format contents and filenames for all posts in one pass.
+        
+        Args:
+            posts: List of post dictionaries
+        
+        Returns:
+            Tuple of (contents, filenames), aligned with posts
+        """
+        contents = [self.format_post_content(post) for post in posts]
+        filenames = [self.get_post_filename(post) for post in posts]
+        return contents, filenames
+
+
+def _copy_file(src: Path, dst: Path):
+    """
+    Copy a file using the kernel's copy path where available.
+    
+    Uses CopyFileW on Windows and copy_file_range on Linux, falling back
+    to shutil.copyfile if neither applies or the fast path fails.
+    """
+    if sys.platform == "win32":
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            return
+        logger.debug(f"CopyFileW failed (error {ctypes.GetLastError()}), using shutil")
+    
+    elif hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as s, open(dst, 'wb') as d:
+                remaining = os.fstat(s.fileno()).st_size
+                os.posix_fadvise(s.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                while remaining > 0:
+                    copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            
+            if remaining == 0:
+                return
+        except OSError as e:
+            logger.debug(f"copy_file_range failed ({e}), using shutil")
+    
+    shutil.copyfile(src, dst)
 
 
 def create_fallback_data():
@@ -173,8 +316,7 @@ def create_fallback_data():
     fallback_path = Path(__file__).parent / "fallback_data.json"
     
     if uploads_data.exists():
-        import shutil
-        shutil.copy(uploads_data, fallback_path)
+        _copy_file(uploads_data, fallback_path)
         logger.info(f"Created fallback data: {fallback_path}")
     else:
         logger.warning("data.json not found in uploads")
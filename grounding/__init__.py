@@ -1,15 +1,40 @@
-from .base_grounding import BaseGrounding, MultiStrategyGrounding
-from .screenshot import ScreenCapture
-from .template_grounding import TemplateGrounding, AdaptiveTemplateGrounding
-from .ocr_grounding import OCRGrounding, FuzzyOCRGrounding
+import importlib
 
+# Strategies are imported on first attribute access (PEP 562) so that
+# unused backends (BotCity, EasyOCR) don't load at startup.
+_LAZY_IMPORTS = {
+    'BaseGrounding': ('grounding.base_grounding', 'BaseGrounding'),
+    'MultiStrategyGrounding': ('grounding.base_grounding', 'MultiStrategyGrounding'),
+    'GroundingContext': ('grounding.base_grounding', 'GroundingContext'),
+    'ScreenCapture': ('grounding.screenshot', 'ScreenCapture'),
+    'CapturedFrame': ('grounding.screenshot', 'CapturedFrame'),
+    'TemplateGrounding': ('grounding.template_grounding', 'TemplateGrounding'),
+    'AdaptiveTemplateGrounding': ('grounding.template_grounding', 'AdaptiveTemplateGrounding'),
+    'OCRGrounding': ('grounding.ocr_grounding', 'OCRGrounding'),
+    'FuzzyOCRGrounding': ('grounding.ocr_grounding', 'FuzzyOCRGrounding'),
+}
 
 __all__ = [
     'BaseGrounding',
     'MultiStrategyGrounding',
+    'GroundingContext',
     'ScreenCapture',
+    'CapturedFrame',
     'TemplateGrounding',
     'AdaptiveTemplateGrounding',
     'OCRGrounding',
     'FuzzyOCRGrounding',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,109 @@
+import numpy as np
+
+# Inner loops of the FFT template matcher. They are JIT-compiled with Numba
+# when it is installed (cache=True keeps the compiled code on disk between
+# runs); otherwise the equivalent NumPy versions below are used.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _window_sums(table: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Sum of every height x width window, read from a summed-area table."""
+    return (
+        table[height:, width:] - table[:-height, width:]
+        - table[height:, :-width] + table[:-height, :-width]
+    )
+
+
+def _ncc_denominator_numpy(
+    integral: np.ndarray,
+    integral_sq: np.ndarray,
+    t_height: int,
+    t_width: int,
+    t_norm: float
+) -> np.ndarray:
+    """
+    NCC denominator (window standard deviation x template norm) for every
+    template position, from summed-area tables of the image and its square.
+    
+    Returns:
+        (H - th, W - tw) array for (H, W) summed-area tables
+    """
+    window_sum = _window_sums(integral, t_height, t_width)
+    window_sq = _window_sums(integral_sq, t_height, t_width)
+    variance = np.maximum(window_sq - window_sum * window_sum / (t_height * t_width), 0)
+    return np.sqrt(variance) * t_norm
+
+
+def _top_peaks_numpy(
+    scores: np.ndarray,
+    count: int,
+    min_score: float,
+    half_h: int,
+    half_w: int
+) -> np.ndarray:
+    """
+    Highest peaks of a score map, suppressing a +/- (half_h, half_w)
+    neighbourhood around each pick.
+    
+    Returns:
+        (n, 2) array of (y, x) positions scoring at least min_score, n <= count
+    """
+    work = scores.copy()
+    peaks = np.empty((count, 2), dtype=np.int64)
+    found = 0
+    for _ in range(count):
+        y, x = np.unravel_index(np.argmax(work), work.shape)
+        if work[y, x] < min_score:
+            break
+        peaks[found] = y, x
+        found += 1
+        work[max(0, y - half_h):y + half_h + 1, max(0, x - half_w):x + half_w + 1] = -np.inf
+    return peaks[:found]
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ncc_denominator_numba(integral, integral_sq, t_height, t_width, t_norm):
+        rows = integral.shape[0] - t_height
+        cols = integral.shape[1] - t_width
+        area = t_height * t_width
+        out = np.empty((rows, cols), dtype=np.float64)
+        for y in prange(rows):
+            for x in range(cols):
+                s = (integral[y + t_height, x + t_width] - integral[y, x + t_width]
+                     - integral[y + t_height, x] + integral[y, x])
+                s2 = (integral_sq[y + t_height, x + t_width] - integral_sq[y, x + t_width]
+                      - integral_sq[y + t_height, x] + integral_sq[y, x])
+                out[y, x] = np.sqrt(max(s2 - s * s / area, 0.0)) * t_norm
+        return out
+
+    # No fastmath here: suppressed entries are set to -inf
+    @njit(cache=True)
+    def _top_peaks_numba(scores, count, min_score, half_h, half_w):
+        work = scores.copy()
+        height, width = work.shape
+        peaks = np.empty((count, 2), dtype=np.int64)
+        found = 0
+        for _ in range(count):
+            index = np.argmax(work)
+            y = index // width
+            x = index % width
+            if work[y, x] < min_score:
+                break
+            peaks[found, 0] = y
+            peaks[found, 1] = x
+            found += 1
+            for yy in range(max(0, y - half_h), min(height, y + half_h + 1)):
+                for xx in range(max(0, x - half_w), min(width, x + half_w + 1)):
+                    work[yy, xx] = -np.inf
+        return peaks[:found]
+
+    ncc_denominator = _ncc_denominator_numba
+    top_peaks = _top_peaks_numba
+else:
+    ncc_denominator = _ncc_denominator_numpy
+    top_peaks = _top_peaks_numpy
@@ -1,9 +1,60 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Any, Callable, List, Tuple, Optional
 from PIL import Image
+import numpy as np
 from utils.logger import LoggerMixin
 
 
+class GroundingContext:
+    """
+    Per-screenshot data shared by the strategies of one grounding attempt.
+    
+    Lets several strategies reuse one numpy conversion, one set of OCR
+    results and any other preprocessing (see cached) instead of each
+    recomputing them from the screenshot.
+    """
+    
+    def __init__(self, screenshot: Image.Image, gray: np.ndarray = None):
+        """
+        Initialize context for a screenshot.
+        
+        Args:
+            screenshot: PIL Image all strategies will search
+            gray: Optional precomputed uint8 grayscale of the screenshot
+        """
+        self.screenshot = screenshot
+        self.ocr_results = {}
+        self._img_np = None
+        self._gray = gray
+        self._cache = {}
+    
+    @property
+    def img_np(self) -> np.ndarray:
+        """Screenshot as a contiguous uint8 array, converted on first use."""
+        if self._img_np is None:
+            self._img_np = np.ascontiguousarray(np.asarray(self.screenshot, dtype=np.uint8))
+        return self._img_np
+    
+    @property
+    def gray(self) -> np.ndarray:
+        """Screenshot as a uint8 grayscale array, converted on first use."""
+        if self._gray is None:
+            self._gray = np.asarray(self.screenshot.convert('L'))
+        return self._gray
+    
+    def cached(self, key, factory: Callable[[], Any]) -> Any:
+        """
+        Return preprocessing stored under key, computing it on first use.
+        
+        Args:
+            key: Hashable name of the derived data (e.g. ('gray',))
+            factory: Builds the data from the screenshot
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+
 class BaseGrounding(ABC, LoggerMixin):
     """
     Abstract base class for all grounding strategies.
@@ -19,6 +70,7 @@ class BaseGrounding(ABC, LoggerMixin):
             name: Optional name for this strategy
         """
         self.name = name or self.__class__.__name__
+        self.last_candidates = []
         self.logger.info(f"Initialized {self.name} grounding strategy")
     
     @abstractmethod
@@ -34,7 +86,8 @@ class BaseGrounding(ABC, LoggerMixin):
         Args:
             screenshot: PIL Image of the screen
             target: Target to locate (interpretation depends on strategy)
-            **kwargs: Additional strategy-specific parameters
+            **kwargs: Additional strategy-specific parameters; strategies
+                should accept (and may ignore) a `ctx` GroundingContext
         
         Returns:
             Tuple of (x, y) coordinates if found, None otherwise
@@ -51,6 +104,15 @@ class BaseGrounding(ABC, LoggerMixin):
         """
         pass
     
+    def get_last_candidates(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Get regions the last failed locate considered promising.
+        
+        Returns:
+            List of (left, top, width, height) regions, possibly empty
+        """
+        return self.last_candidates
+    
     def validate_result(
         self,
         coords: Tuple[int, int],
@@ -72,7 +134,7 @@ class BaseGrounding(ABC, LoggerMixin):
         x, y = coords
         width, height = screenshot.size
         
-        if not (0 <= x < width and 0 <= y < height):
+        if x < 0 or x >= width or y < 0 or y >= height:
             self.logger.warning(
                 f"Coordinates ({x}, {y}) out of bounds for {width}x{height} screen"
             )
@@ -80,6 +142,37 @@ class BaseGrounding(ABC, LoggerMixin):
         
         return True
     
+    def validate_results(
+        self,
+        coords_list: List[Tuple[int, ...]],
+        screenshot: Image.Image
+    ) -> np.ndarray:
+        """
+        Validate many candidates against screenshot bounds in one pass.
+        
+        Args:
+            coords_list: (x, y, ...) tuples, e.g. from find_multiple
+            screenshot: Screenshot image
+        
+        Returns:
+            Boolean array, True where the coordinates are within bounds
+        """
+        if not coords_list:
+            return np.zeros(0, dtype=bool)
+        
+        width, height = screenshot.size
+        points = np.asarray([c[:2] for c in coords_list])
+        x, y = points[:, 0], points[:, 1]
+        valid = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        
+        invalid = len(valid) - int(valid.sum())
+        if invalid:
+            self.logger.warning(
+                f"{invalid}/{len(valid)} candidates out of bounds for {width}x{height} screen"
+            )
+        
+        return valid
+    
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
 
@@ -119,7 +212,7 @@ class MultiStrategyGrounding(LoggerMixin):
         Try each strategy in order until one succeeds.
         
         Args:
-            screenshot: PIL Image of screen
+            screenshot: PIL Image of screen, or a CapturedFrame
             target: Target to locate
             **kwargs: Parameters passed to each strategy
         
@@ -128,11 +221,26 @@ class MultiStrategyGrounding(LoggerMixin):
         """
         self.logger.info(f"Attempting to locate '{target}' using {len(self.strategies)} strategies")
         
+        # A CapturedFrame carries the grayscale made at capture time
+        gray = None
+        if hasattr(screenshot, 'pil_rgb'):
+            gray = screenshot.np_gray
+            screenshot = screenshot.pil_rgb
+        
+        # Share preprocessing (numpy conversion, OCR results) across strategies
+        ctx = kwargs.pop('ctx', None) or GroundingContext(screenshot, gray)
+        
+        # Regions an earlier strategy nearly matched; later ones search there first
+        candidates = kwargs.pop('candidate_rois', None) or []
+        
         for i, strategy in enumerate(self.strategies, 1):
-            self.logger.debug(f"Trying strategy {i}/{len(self.strategies)}: {strategy.name}")
+            self.logger.debug("Trying strategy %d/%d: %s", i, len(self.strategies), strategy.name)
             
             try:
-                coords = strategy.locate(screenshot, target, **kwargs)
+                if candidates:
+                    kwargs['candidate_rois'] = candidates
+                coords = strategy.locate(screenshot, target, ctx=ctx, **kwargs)
+                candidates = strategy.get_last_candidates() or candidates
                 
                 if coords and strategy.validate_result(coords, screenshot):
                     confidence = strategy.get_confidence()
@@ -143,7 +251,7 @@ class MultiStrategyGrounding(LoggerMixin):
                     self.last_successful_strategy = strategy
                     return coords
                 else:
-                    self.logger.debug(f"Strategy '{strategy.name}' found no match")
+                    self.logger.debug("Strategy '%s' found no match", strategy.name)
                     
             except Exception as e:
                 self.logger.warning(f"Strategy '{strategy.name}' failed: {e}")
@@ -1,8 +1,10 @@
-from typing import Tuple, Optional, List
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, List
 from PIL import Image
 import numpy as np
 import config
-from grounding.base_grounding import BaseGrounding
+from grounding.base_grounding import BaseGrounding, GroundingContext
 
 try:
     import easyocr
@@ -13,6 +15,92 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+# Stop scanning detections once a match is at least this confident
+EXACT_EARLY_EXIT_CONFIDENCE = 0.95
+EARLY_EXIT_CONFIDENCE = 0.98
+
+# Number of recent (image hash -> OCR results) entries kept per instance
+OCR_RESULT_CACHE_SIZE = 4
+
+
+def _to_numpy(screenshot: Image.Image, grayscale: bool = False) -> np.ndarray:
+    """
+    View a PIL image as a contiguous uint8 array without an extra copy.
+    
+    Alpha and palette images are converted to RGB first so no unused
+    channel is carried into OCR. With grayscale=True a single-channel
+    array is returned, which EasyOCR accepts directly.
+    """
+    if grayscale:
+        if screenshot.mode != 'L':
+            screenshot = screenshot.convert('L')
+    elif screenshot.mode != 'RGB':
+        screenshot = screenshot.convert('RGB')
+    return np.ascontiguousarray(np.asarray(screenshot, dtype=np.uint8))
+
+
+def _bbox_center(bbox) -> Tuple[int, int]:
+    """Center of an EasyOCR 4-point bounding box."""
+    cx, cy = np.asarray(bbox, dtype=np.float32).mean(axis=0).astype(np.int32)
+    return int(cx), int(cy)
+
+
+def _bbox_centers(bboxes: list) -> np.ndarray:
+    """Centers of many 4-point bounding boxes at once, as an (N, 2) int array."""
+    if not bboxes:
+        return np.empty((0, 2), dtype=np.int32)
+    points = np.asarray(bboxes, dtype=np.float32)
+    return points.mean(axis=1).astype(np.int32)
+
+
+def _roi_union(rois: List[Tuple[int, int, int, int]]) -> Tuple[int, int, int, int]:
+    """Bounding (left, top, width, height) of several regions."""
+    left = min(r[0] for r in rois)
+    top = min(r[1] for r in rois)
+    right = max(r[0] + r[2] for r in rois)
+    bottom = max(r[1] + r[3] for r in rois)
+    return left, top, right - left, bottom - top
+
+
+def _inference_mode():
+    """
+    Context manager that disables autograd tracking for EasyOCR calls.
+    
+    torch.inference_mode also skips the view/version-counter bookkeeping
+    that torch.no_grad (used inside EasyOCR) still pays for.
+    """
+    import torch
+    return torch.inference_mode()
+
+
+def _detect_device() -> str:
+    """
+    Pick the best available torch device for EasyOCR.
+    
+    Returns:
+        "cuda", "mps" or "cpu"
+    """
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    
+    if torch.cuda.is_available():
+        return "cuda"
+    
+    mps = getattr(torch.backends, 'mps', None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    
+    return "cpu"
+
 
 class OCRGrounding(BaseGrounding):
     """
@@ -20,12 +108,18 @@ class OCRGrounding(BaseGrounding):
     Good for finding buttons, labels, and icons with text.
     """
     
+    # Readers shared across instances, keyed by (languages, device)
+    _reader_cache: Dict[Tuple, "easyocr.Reader"] = {}
+    
     def __init__(
         self,
         languages: List[str] = None,
         confidence_threshold: float = None,
-        use_gpu: bool = False,
-        name: str = "OCR"
+        device: str = "auto",
+        name: str = "OCR",
+        max_ocr_dim: int = None,
+        quantize: bool = True,
+        grayscale: bool = False
     ):
         """
         Initialize OCR grounding.
@@ -33,8 +127,13 @@ class OCRGrounding(BaseGrounding):
         Args:
             languages: List of language codes (default: ['en'])
             confidence_threshold: Minimum confidence for detections
-            use_gpu: Whether to use GPU acceleration
+            device: "auto" (detect CUDA/MPS), "cuda", "mps" or "cpu"
             name: Name for this strategy
+            max_ocr_dim: Longest image side passed to OCR; larger screenshots
+                are downscaled and coordinates mapped back
+            quantize: Let EasyOCR apply int8 dynamic quantization to its
+                models (CPU only; ignored on GPU devices)
+            grayscale: Feed OCR a single luminance channel instead of RGB
         """
         super().__init__(name)
         
@@ -46,17 +145,155 @@ class OCRGrounding(BaseGrounding):
         self.confidence_threshold = confidence_threshold or config.OCR_CONFIDENCE_THRESHOLD
         self.last_confidence = -1
         self.last_detections = []
+        self.max_ocr_dim = max_ocr_dim or config.OCR_MAX_DIM
+        self._ocr_cache: "OrderedDict[bytes, list]" = OrderedDict()
+        
+        self.device = _detect_device() if device == "auto" else device
+        
+        if quantize and self.device != "cpu":
+            self.logger.debug(f"int8 quantization is CPU-only; ignoring it on {self.device}")
+            quantize = False
+        self.quantize = quantize
+        self.grayscale = grayscale
         
-        self.logger.info(f"Initializing EasyOCR reader (languages: {self.languages})...")
-        self.reader = easyocr.Reader(self.languages, gpu=use_gpu)
-        self.logger.info("EasyOCR reader initialized")
+        reader_kwargs = {
+            'gpu': self.device if self.device != "cpu" else False,
+            'quantize': self.quantize
+        }
+        if self.device == "cuda":
+            # Screenshots have a stable size, so let cuDNN pick the fastest kernels
+            reader_kwargs['cudnn_benchmark'] = True
+            # Allow TF32 matmuls on Ampere and newer GPUs
+            import torch
+            torch.set_float32_matmul_precision("high")
+        
+        key = (tuple(sorted(self.languages)), self.device, self.quantize)
+        reader = OCRGrounding._reader_cache.get(key)
+        if reader is None:
+            self.logger.info(
+                f"Initializing EasyOCR reader (languages: {self.languages}, device: {self.device})..."
+            )
+            reader = easyocr.Reader(self.languages, **reader_kwargs)
+            OCRGrounding._reader_cache[key] = reader
+            self.logger.info("EasyOCR reader initialized")
+        else:
+            self.logger.debug(f"Reusing cached EasyOCR reader for {key}")
+        self.reader = reader
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached EasyOCR readers and release GPU memory they held."""
+        OCRGrounding._reader_cache.clear()
+        try:
+            import torch
+        except ImportError:
+            return
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    
+    def _downscale(self, screenshot: Image.Image) -> Tuple[Image.Image, float]:
+        """
+        Shrink screenshot so its longest side is at most max_ocr_dim.
+        
+        Returns:
+            Tuple of (image to OCR, scale factor applied)
+        """
+        width, height = screenshot.size
+        scale = min(1.0, self.max_ocr_dim / max(width, height))
+        if scale >= 1.0:
+            return screenshot, 1.0
+        
+        work = screenshot.resize(
+            (int(width * scale), int(height * scale)),
+            Image.BILINEAR
+        )
+        return work, scale
+    
+    def _crop(
+        self,
+        screenshot: Image.Image,
+        region: Optional[Tuple[int, int, int, int]]
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Crop screenshot to a (left, top, width, height) region.
+        
+        Returns:
+            Tuple of (cropped image, (left, top) offset of the crop)
+        """
+        if not region:
+            return screenshot, (0, 0)
+        
+        left, top, width, height = region
+        return screenshot.crop((left, top, left + width, top + height)), (left, top)
+    
+    def _readtext(self, img_np: np.ndarray) -> list:
+        """
+        Run EasyOCR, reusing results for a pixel-identical recent image.
+        
+        Polling loops often capture the same frame repeatedly while waiting
+        for the UI to change; those frames skip OCR entirely.
+        """
+        digest = hashlib.blake2b(img_np, digest_size=16)
+        digest.update(str(img_np.shape).encode())
+        key = digest.digest()
+        
+        results = self._ocr_cache.get(key)
+        if results is not None:
+            self._ocr_cache.move_to_end(key)
+            self.logger.debug("Screenshot unchanged, reusing cached OCR results")
+            return results
+        
+        with _inference_mode():
+            results = self.reader.readtext(img_np)
+        self._ocr_cache[key] = results
+        if len(self._ocr_cache) > OCR_RESULT_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return results
+    
+    def _run_ocr(
+        self,
+        screenshot: Image.Image,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        ctx: Optional[GroundingContext] = None
+    ) -> Tuple[list, float, Tuple[int, int]]:
+        """
+        Crop, downscale and OCR a screenshot, reusing results cached on ctx.
+        
+        Returns:
+            Tuple of (detections, downscale factor, (left, top) crop offset)
+        """
+        key = (
+            tuple(sorted(self.languages)), self.device, self.quantize,
+            self.grayscale, region, self.max_ocr_dim
+        )
+        if ctx is not None and key in ctx.ocr_results:
+            self.logger.debug("Reusing OCR results from grounding context")
+            return ctx.ocr_results[key]
+        
+        work, offset = self._crop(screenshot, region)
+        work, scale = self._downscale(work)
+        
+        # Convert PIL Image to numpy array for EasyOCR
+        if (ctx is not None and work is ctx.screenshot and
+                work.mode == 'RGB' and not self.grayscale):
+            img_np = ctx.img_np
+        else:
+            img_np = _to_numpy(work, self.grayscale)
+        
+        output = (self._readtext(img_np), scale, offset)
+        if ctx is not None:
+            ctx.ocr_results[key] = output
+        return output
     
     def locate(
         self,
         screenshot: Image.Image,
         target: str,
         case_sensitive: bool = False,
-        exact_match: bool = False
+        exact_match: bool = False,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        ctx: Optional[GroundingContext] = None,
+        candidate_rois: List[Tuple[int, int, int, int]] = None
     ) -> Optional[Tuple[int, int]]:
         """
         Locate target text using OCR.
@@ -66,65 +303,41 @@ class OCRGrounding(BaseGrounding):
             target: Text to search for
             case_sensitive: Whether to match case
             exact_match: If True, require exact match; otherwise partial match
+            region: Optional (left, top, width, height) to restrict the search to
+            ctx: Optional shared context to reuse OCR results from
+            candidate_rois: Regions to OCR first (e.g. a template near-miss);
+                the full screenshot is searched only if they have no match
         
         Returns:
             (x, y) coordinates of text center, or None if not found
         """
-        self.logger.debug(f"OCR searching for text: '{target}'")
+        if candidate_rois and region is None:
+            coords = self.locate(
+                screenshot, target, case_sensitive, exact_match,
+                region=_roi_union(candidate_rois), ctx=ctx
+            )
+            if coords:
+                return coords
+            self.logger.debug("No match in candidate regions, searching full screenshot")
         
-        # Convert PIL Image to numpy array for EasyOCR
-        img_np = np.array(screenshot)
+        self.logger.debug(f"OCR searching for text: '{target}'")
         
         try:
             # Perform OCR
-            results = self.reader.readtext(img_np)
+            results, scale, (left, top) = self._run_ocr(screenshot, region, ctx)
             self.last_detections = results
             
             self.logger.debug(f"OCR detected {len(results)} text regions")
             
-            # Find best match
-            best_match = None
-            best_confidence = 0.0
-            
-            for bbox, text, confidence in results:
-                # Log all detections for debugging
-                self.logger.debug(f"  Detected: '{text}' (confidence: {confidence:.3f})")
-                
-                # Skip low confidence detections
-                if confidence < self.confidence_threshold:
-                    continue
-                
-                # Prepare texts for comparison
-                detected_text = text.strip()
-                search_text = target.strip()
-                
-                if not case_sensitive:
-                    detected_text = detected_text.lower()
-                    search_text = search_text.lower()
-                
-                # Check for match
-                is_match = False
-                if exact_match:
-                    is_match = (detected_text == search_text)
-                else:
-                    is_match = (search_text in detected_text)
-                
-                if is_match and confidence > best_confidence:
-                    # Calculate center of bounding box
-                    x_coords = [p[0] for p in bbox]
-                    y_coords = [p[1] for p in bbox]
-                    cx = int(sum(x_coords) / len(x_coords))
-                    cy = int(sum(y_coords) / len(y_coords))
-                    
-                    best_match = (cx, cy)
-                    best_confidence = confidence
-                    
-                    self.logger.debug(
-                        f"  Match! '{text}' at ({cx}, {cy}) "
-                        f"[confidence: {confidence:.3f}]"
-                    )
+            best_match, best_confidence = self._find_best_match(
+                results, target, case_sensitive, exact_match
+            )
             
             if best_match:
+                best_match = (
+                    int(best_match[0] / scale) + left,
+                    int(best_match[1] / scale) + top
+                )
                 self.last_confidence = best_confidence
                 self.logger.info(
                     f"✓ OCR found '{target}' at {best_match} "
@@ -141,6 +354,148 @@ class OCRGrounding(BaseGrounding):
             self.last_confidence = -1
             return None
     
+    def _find_best_match(
+        self,
+        results: list,
+        target: str,
+        case_sensitive: bool = False,
+        exact_match: bool = False
+    ) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Pick the highest-confidence detection matching the target text.
+        
+        Args:
+            results: EasyOCR (bbox, text, confidence) detections
+            target: Text to search for
+            case_sensitive: Whether to match case
+            exact_match: If True, require exact match; otherwise partial match
+        
+        Returns:
+            Tuple of ((x, y) center or None, confidence)
+        """
+        best_match = None
+        best_confidence = 0.0
+        
+        search_text = target.strip() if case_sensitive else target.strip().lower()
+        
+        for bbox, text, confidence in results:
+            # Log all detections for debugging
+            self.logger.debug("  Detected: '%s' (confidence: %.3f)", text, confidence)
+            
+            # Skip low confidence detections
+            if confidence < self.confidence_threshold:
+                continue
+            
+            # Prepare detected text for comparison
+            detected_text = text.strip()
+            if not case_sensitive:
+                detected_text = detected_text.lower()
+            
+            # Check for match
+            is_match = False
+            if exact_match:
+                is_match = (detected_text == search_text)
+            else:
+                is_match = (search_text in detected_text)
+            
+            if is_match and confidence > best_confidence:
+                # Calculate center of bounding box
+                cx, cy = _bbox_center(bbox)
+                
+                best_match = (cx, cy)
+                best_confidence = confidence
+                
+                self.logger.debug(
+                    "  Match! '%s' at (%d, %d) [confidence: %.3f]",
+                    text, cx, cy, confidence
+                )
+                
+                # A near-certain hit won't be beaten by a later detection
+                if best_confidence > (EXACT_EARLY_EXIT_CONFIDENCE if exact_match else EARLY_EXIT_CONFIDENCE):
+                    break
+        
+        return best_match, best_confidence
+    
+    def locate_many(
+        self,
+        screenshots: List[Image.Image],
+        target: str,
+        n_width: int = None,
+        n_height: int = None,
+        case_sensitive: bool = False,
+        exact_match: bool = False
+    ) -> List[Optional[Tuple[int, int]]]:
+        """
+        Locate target text in several screenshots with one batched OCR pass.
+        
+        Images are resized to (n_width, n_height) for batching if given;
+        otherwise all screenshots must have the same size.
+        
+        Args:
+            screenshots: PIL Images to search
+            target: Text to search for
+            n_width: Width to normalize images to before batching
+            n_height: Height to normalize images to before batching
+            case_sensitive: Whether to match case
+            exact_match: If True, require exact match; otherwise partial match
+        
+        Returns:
+            One (x, y) coordinate (or None) per screenshot, in input coordinates
+        """
+        if not screenshots:
+            return []
+        
+        self.logger.debug(f"Batched OCR over {len(screenshots)} screenshots for '{target}'")
+        
+        try:
+            images = [_to_numpy(screenshot, self.grayscale) for screenshot in screenshots]
+            with _inference_mode():
+                batch_results = self.reader.readtext_batched(
+                    images,
+                    n_width=n_width,
+                    n_height=n_height
+                )
+        except Exception as e:
+            self.logger.error(f"Batched OCR error: {e}")
+            self.last_confidence = -1
+            return [None] * len(screenshots)
+        
+        matches = []
+        best_overall = 0.0
+        
+        for screenshot, results in zip(screenshots, batch_results):
+            coords, confidence = self._find_best_match(
+                results, target, case_sensitive, exact_match
+            )
+            
+            # Map from the normalized batch size back to screenshot pixels
+            if coords and n_width and n_height:
+                width, height = screenshot.size
+                coords = (
+                    int(coords[0] * width / n_width),
+                    int(coords[1] * height / n_height)
+                )
+            
+            matches.append(coords)
+            best_overall = max(best_overall, confidence)
+        
+        self.last_confidence = best_overall
+        return matches
+    
+    def warmup_batched(self, batch_size: int, n_width: int, n_height: int):
+        """
+        Run one dummy batch so later locate_many calls don't pay first-call setup.
+        
+        Args:
+            batch_size: Number of images per batch
+            n_width: Normalized image width
+            n_height: Normalized image height
+        """
+        dummy = np.zeros([batch_size, n_height, n_width, 3], dtype=np.uint8)
+        with _inference_mode():
+            self.reader.readtext_batched(dummy, n_width=n_width, n_height=n_height)
+        self.logger.debug(f"Warmed up batched OCR ({batch_size}x{n_width}x{n_height})")
+    
     def get_confidence(self) -> float:
         """Get confidence of last match."""
         return self.last_confidence
@@ -155,16 +510,13 @@ class OCRGrounding(BaseGrounding):
         Returns:
             List of (text, confidence, (x, y)) tuples
         """
-        img_np = np.array(screenshot)
-        results = self.reader.readtext(img_np)
+        img_np = _to_numpy(screenshot, self.grayscale)
+        results = self._readtext(img_np)
+        
+        centers = _bbox_centers([bbox for bbox, _, _ in results])
         
         text_results = []
-        for bbox, text, confidence in results:
-            x_coords = [p[0] for p in bbox]
-            y_coords = [p[1] for p in bbox]
-            cx = int(sum(x_coords) / len(x_coords))
-            cy = int(sum(y_coords) / len(y_coords))
-            
+        for (_, text, confidence), (cx, cy) in zip(results, centers.tolist()):
             text_results.append((text, confidence, (cx, cy)))
         
         return text_results
@@ -186,19 +538,22 @@ class OCRGrounding(BaseGrounding):
         Returns:
             List of (x, y, confidence) tuples
         """
-        img_np = np.array(screenshot)
-        results = self.reader.readtext(img_np)
+        img_np = _to_numpy(screenshot, self.grayscale)
+        results = self._readtext(img_np)
         
-        matches = []
-        for bbox, text, confidence in results:
-            if target.lower() in text.strip().lower() and \
-               confidence >= self.confidence_threshold:
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
-                cx = int(sum(x_coords) / len(x_coords))
-                cy = int(sum(y_coords) / len(y_coords))
-                
-                matches.append((cx, cy, confidence))
+        search_text = target.lower()
+        hits = [
+            (bbox, confidence) for bbox, text, confidence in results
+            if confidence >= self.confidence_threshold and
+            search_text in text.strip().lower()
+        ]
+        
+        # Compute all centers in one vectorized pass
+        centers = _bbox_centers([bbox for bbox, _ in hits])
+        matches = [
+            (cx, cy, confidence)
+            for (cx, cy), (_, confidence) in zip(centers.tolist(), hits)
+        ]
         
         # Sort by confidence
         matches.sort(key=lambda x: x[2], reverse=True)
@@ -220,7 +575,8 @@ class FuzzyOCRGrounding(OCRGrounding):
         languages: List[str] = None,
         confidence_threshold: float = None,
         fuzzy_threshold: float = 0.8,
-        name: str = "FuzzyOCR"
+        name: str = "FuzzyOCR",
+        device: str = "auto"
     ):
         """
         Initialize fuzzy OCR grounding.
@@ -230,21 +586,28 @@ class FuzzyOCRGrounding(OCRGrounding):
             confidence_threshold: Minimum OCR confidence
             fuzzy_threshold: Minimum string similarity (0-1)
             name: Name for this strategy
+            device: "auto" (detect CUDA/MPS), "cuda", "mps" or "cpu"
         """
-        super().__init__(languages, confidence_threshold, False, name)
+        super().__init__(languages, confidence_threshold, device, name)
         self.fuzzy_threshold = fuzzy_threshold
         
-        try:
-            from difflib import SequenceMatcher
-            self.matcher = SequenceMatcher
-            self.logger.info(f"Fuzzy matching enabled (threshold: {fuzzy_threshold})")
-        except ImportError:
-            self.logger.warning("difflib not available, falling back to substring matching")
+        if RAPIDFUZZ_AVAILABLE:
             self.matcher = None
+            self.logger.info(f"Fuzzy matching enabled via rapidfuzz (threshold: {fuzzy_threshold})")
+        else:
+            try:
+                from difflib import SequenceMatcher
+                self.matcher = SequenceMatcher
+                self.logger.info(f"Fuzzy matching enabled (threshold: {fuzzy_threshold})")
+            except ImportError:
+                self.logger.warning("difflib not available, falling back to substring matching")
+                self.matcher = None
     
     def _fuzzy_match(self, text1: str, text2: str) -> float:
         """Calculate fuzzy similarity between two strings."""
-        if self.matcher:
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(text1.lower(), text2.lower()) / 100.0
+        elif self.matcher:
             return self.matcher(None, text1.lower(), text2.lower()).ratio()
         else:
             # Simple fallback: check if one is substring of other
@@ -253,6 +616,27 @@ class FuzzyOCRGrounding(OCRGrounding):
                 return 0.9
             return 0.0
     
+    def _similarities(self, texts: List[str], target: str) -> List[Tuple[int, float]]:
+        """
+        Score every detected text against the target.
+        
+        Returns:
+            (index, similarity) pairs for texts at or above fuzzy_threshold
+        """
+        if RAPIDFUZZ_AVAILABLE:
+            # One C-level pass over all detections
+            hits = process.extract(
+                target.lower(),
+                [text.lower() for text in texts],
+                scorer=fuzz.ratio,
+                limit=None,
+                score_cutoff=self.fuzzy_threshold * 100
+            )
+            return [(index, score / 100.0) for _, score, index in hits]
+        
+        scores = [(i, self._fuzzy_match(text, target)) for i, text in enumerate(texts)]
+        return [(i, score) for i, score in scores if score >= self.fuzzy_threshold]
+    
     def locate(
         self,
         screenshot: Image.Image,
@@ -265,41 +649,56 @@ class FuzzyOCRGrounding(OCRGrounding):
         Args:
             screenshot: PIL Image of screen
             target: Text to search for
+            region: Optional (left, top, width, height) to restrict the search to
+            ctx: Optional shared context to reuse OCR results from
+            candidate_rois: Regions to OCR first; the full screenshot is
+                searched only if they have no match
         
         Returns:
             Coordinates of best match
         """
-        img_np = np.array(screenshot)
-        results = self.reader.readtext(img_np)
+        candidate_rois = kwargs.pop('candidate_rois', None)
+        region = kwargs.pop('region', None)
+        if candidate_rois and not region:
+            coords = self.locate(
+                screenshot, target, region=_roi_union(candidate_rois), **kwargs
+            )
+            if coords:
+                return coords
+            self.logger.debug("No match in candidate regions, searching full screenshot")
+        
+        results, scale, (left, top) = self._run_ocr(screenshot, region, kwargs.get('ctx'))
         
         best_match = None
         best_score = 0.0
         
-        for bbox, text, ocr_conf in results:
-            if ocr_conf < self.confidence_threshold:
-                continue
-            
-            # Calculate fuzzy similarity
-            similarity = self._fuzzy_match(text.strip(), target.strip())
+        confident = [r for r in results if r[2] >= self.confidence_threshold]
+        texts = [text.strip() for _, text, _ in confident]
+        
+        search_text = target.strip()
+        
+        for index, similarity in self._similarities(texts, search_text):
+            bbox, text, ocr_conf = confident[index]
             
             # Combined score: OCR confidence * fuzzy similarity
             combined_score = ocr_conf * similarity
             
-            if similarity >= self.fuzzy_threshold and combined_score > best_score:
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
-                cx = int(sum(x_coords) / len(x_coords))
-                cy = int(sum(y_coords) / len(y_coords))
+            if combined_score > best_score:
+                cx, cy = _bbox_center(bbox)
                 
                 best_match = (cx, cy)
                 best_score = combined_score
                 
                 self.logger.debug(
-                    f"Fuzzy match: '{text}' vs '{target}' "
-                    f"(similarity: {similarity:.3f}, score: {combined_score:.3f})"
+                    "Fuzzy match: '%s' vs '%s' (similarity: %.3f, score: %.3f)",
+                    text, target, similarity, combined_score
                 )
         
         if best_match:
+            best_match = (
+                int(best_match[0] / scale) + left,
+                int(best_match[1] / scale) + top
+            )
             self.last_confidence = best_score
             self.logger.info(f"✓ Fuzzy OCR found match at {best_match} (score: {best_score:.3f})")
         else:
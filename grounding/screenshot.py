@@ -1,13 +1,119 @@
+import itertools
 import pyautogui
+import threading
+import time
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
-from datetime import datetime
 from typing import Tuple, Optional
 import config
 from utils.logger import setup_logger
 
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
+# Debug images are encoded off the automation thread; PIL releases the GIL while encoding
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="debug-save")
+
+# Suffix for generated filenames so saves within the same second don't collide
+_SAVE_COUNTER = itertools.count()
+
+_FONT_CACHE = {}
+
+
+def _timestamp() -> str:
+    """Unique filename stamp: local time plus a per-process counter."""
+    return f"{time.strftime('%Y%m%d_%H%M%S')}_{next(_SAVE_COUNTER):04d}"
+
+
+def _get_font(size: int = 14):
+    """Load (once) the label font at the given size, falling back to PIL's default."""
+    if size not in _FONT_CACHE:
+        try:
+            _FONT_CACHE[size] = ImageFont.truetype("arial.ttf", size)
+        except Exception:
+            _FONT_CACHE[size] = ImageFont.load_default()
+    return _FONT_CACHE[size]
+
+
+# Fast, lossy-where-possible encoder settings for debug output
+_DEBUG_FORMATS = {
+    'JPEG': ('.jpg', {'quality': 85, 'optimize': False}),
+    'WEBP': ('.webp', {'quality': 80, 'method': 0}),
+    'PNG': ('.png', {'optimize': False, 'compress_level': 1}),
+}
+
+
+def _write_debug_image(image: Image.Image, filepath: Path, image_format: str):
+    """Encode a debug image with fast settings (runs on _SAVE_POOL)."""
+    _, options = _DEBUG_FORMATS[image_format]
+    try:
+        if image_format != 'PNG':
+            image = image.convert('RGB')
+        image.save(filepath, image_format, **options)
+        logger.info(f"Debug screenshot saved: {filepath}")
+    except Exception as e:
+        logger.error(f"Failed to save debug screenshot {filepath}: {e}")
+
+
+# mss handles are not safe to share across threads, so keep one per thread
+_local = threading.local()
+
+
+def _get_sct():
+    """Return this thread's cached mss instance."""
+    sct = getattr(_local, 'sct', None)
+    if sct is None:
+        sct = mss.mss()
+        _local.sct = sct
+    return sct
+
+
+def _grab(region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+    """Capture the primary monitor (or a region of it) with mss."""
+    sct = _get_sct()
+    if region:
+        left, top, width, height = region
+        monitor = {"left": left, "top": top, "width": width, "height": height}
+    else:
+        monitor = sct.monitors[1]
+    
+    raw = sct.grab(monitor)
+    return Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
+
+
+@dataclass
+class CapturedFrame:
+    """
+    A screenshot plus the grayscale view grounding strategies share.
+    
+    The grayscale array is made once, on first use, instead of by each
+    strategy separately.
+    """
+    pil_rgb: Image.Image
+    _gray: Optional[np.ndarray] = field(default=None, repr=False)
+    
+    @property
+    def np_gray(self) -> np.ndarray:
+        """uint8 grayscale array of the screenshot."""
+        if self._gray is None:
+            rgb = np.asarray(self.pil_rgb.convert('RGB'))
+            self._gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+        return self._gray
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height) of the screenshot."""
+        return self.pil_rgb.size
+
 
 class ScreenCapture:
     """Handles screen capture operations."""
@@ -26,9 +132,14 @@ class ScreenCapture:
         try:
             if region:
                 logger.debug(f"Capturing screen region: {region}")
-                screenshot = pyautogui.screenshot(region=region)
             else:
                 logger.debug("Capturing full screen")
+            
+            if MSS_AVAILABLE:
+                screenshot = _grab(region)
+            elif region:
+                screenshot = pyautogui.screenshot(region=region)
+            else:
                 screenshot = pyautogui.screenshot()
             
             return screenshot
@@ -37,6 +148,19 @@ class ScreenCapture:
             logger.error(f"Failed to capture screenshot: {e}")
             raise
     
+    @staticmethod
+    def capture_frame(region: Optional[Tuple[int, int, int, int]] = None) -> CapturedFrame:
+        """
+        Capture a screenshot wrapped for sharing across grounding strategies.
+        
+        Args:
+            region: Optional tuple (left, top, width, height) for partial capture
+        
+        Returns:
+            CapturedFrame of the screenshot
+        """
+        return CapturedFrame(ScreenCapture.capture_screen(region))
+    
     @staticmethod
     def save_screenshot(
         image: Image.Image,
@@ -61,7 +185,7 @@ class ScreenCapture:
         directory.mkdir(parents=True, exist_ok=True)
         
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _timestamp()
             filename = f"screenshot_{timestamp}.png"
         
         filepath = directory / filename
@@ -76,7 +200,8 @@ class ScreenCapture:
         coords: Tuple[int, int],
         label: str = None,
         color: str = "red",
-        radius: int = 15
+        radius: int = 15,
+        inplace: bool = False
     ) -> Image.Image:
         """
         Draw a marker at specified coordinates on an image.
@@ -87,11 +212,12 @@ class ScreenCapture:
             label: Optional text label
             color: Marker color
             radius: Marker radius in pixels
+            inplace: Draw on image itself instead of a copy
         
         Returns:
-            New PIL Image with marker drawn
+            PIL Image with marker drawn (image itself if inplace)
         """
-        img_copy = image.copy()
+        img_copy = image if inplace else image.copy()
         draw = ImageDraw.Draw(img_copy)
         
         x, y = coords
@@ -107,19 +233,14 @@ class ScreenCapture:
         
         # Add label if provided
         if label:
-            try:
-                # Try to use a nice font
-                font = ImageFont.truetype("arial.ttf", 14)
-            except:
-                # Fall back to default font
-                font = ImageFont.load_default()
+            font = _get_font(14)
             
             # Draw text with background
             text_bbox = draw.textbbox((x + radius + 10, y - 10), label, font=font)
             draw.rectangle(text_bbox, fill="white", outline=color)
             draw.text((x + radius + 10, y - 10), label, fill=color, font=font)
         
-        logger.debug(f"Marked coordinates {coords} on image")
+        logger.debug("Marked coordinates %s on image", coords)
         return img_copy
     
     @staticmethod
@@ -127,16 +248,22 @@ class ScreenCapture:
         image: Image.Image,
         coords: Tuple[int, int],
         label: str = None,
-        prefix: str = "debug"
+        prefix: str = "debug",
+        inplace: bool = False
     ) -> Path:
         """
         Save a debug screenshot with marked coordinates.
         
+        The image is written in the background; the returned path may not
+        exist yet when this returns.
+        
         Args:
             image: PIL Image to save
             coords: Coordinates to mark
             label: Optional label for marker
             prefix: Filename prefix
+            inplace: Mark image itself instead of a copy; pass True only if
+                the caller no longer needs the unmarked image
         
         Returns:
             Path where debug screenshot was saved
@@ -151,21 +278,28 @@ class ScreenCapture:
             coords,
             label=label,
             color=config.DEBUG_MARKER_COLOR,
-            radius=config.DEBUG_MARKER_RADIUS
+            radius=config.DEBUG_MARKER_RADIUS,
+            inplace=inplace
         )
         
+        image_format = config.DEBUG_IMAGE_FORMAT.upper()
+        if image_format not in _DEBUG_FORMATS:
+            logger.warning(f"Unknown DEBUG_IMAGE_FORMAT '{image_format}', using PNG")
+            image_format = 'PNG'
+        extension, _ = _DEBUG_FORMATS[image_format]
+        
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{prefix}_{timestamp}.png"
-        
-        # Save to screenshots directory
-        filepath = ScreenCapture.save_screenshot(
-            marked_image,
-            filename=filename,
-            directory=config.SCREENSHOTS_DIR
-        )
+        timestamp = _timestamp()
+        filename = f"{prefix}_{timestamp}{extension}"
         
-        logger.info(f"Debug screenshot saved: {filepath}")
+        # Save to screenshots directory without blocking the caller
+        directory = Path(config.SCREENSHOTS_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        filepath = directory / filename
+        
+        _SAVE_POOL.submit(_write_debug_image, marked_image, filepath, image_format)
+        
+        logger.debug(f"Debug screenshot queued: {filepath}")
         return filepath
     
     @staticmethod
@@ -188,37 +322,37 @@ class ScreenCapture:
         if not images:
             raise ValueError("No images provided")
         
+        arrays = [np.asarray(img.convert('RGB')) for img in images]
+        
         if layout == "horizontal":
-            total_width = sum(img.width for img in images)
-            max_height = max(img.height for img in images)
-            combined = Image.new('RGB', (total_width, max_height), 'white')
-            
-            x_offset = 0
-            for i, img in enumerate(images):
-                combined.paste(img, (x_offset, 0))
-                
-                # Add label if provided
-                if labels and i < len(labels):
-                    draw = ImageDraw.Draw(combined)
-                    draw.text((x_offset + 10, 10), labels[i], fill="red")
-                
-                x_offset += img.width
+            # Pad shorter images at the bottom with white, then join side by side
+            max_height = max(a.shape[0] for a in arrays)
+            arrays = [
+                np.pad(a, ((0, max_height - a.shape[0]), (0, 0), (0, 0)), constant_values=255)
+                if a.shape[0] != max_height else a
+                for a in arrays
+            ]
+            combined = Image.fromarray(np.hstack(arrays))
+            offsets = np.cumsum([0] + [img.width for img in images[:-1]])
+            positions = [(int(x) + 10, 10) for x in offsets]
         
         else:  # vertical
-            max_width = max(img.width for img in images)
-            total_height = sum(img.height for img in images)
-            combined = Image.new('RGB', (max_width, total_height), 'white')
-            
-            y_offset = 0
-            for i, img in enumerate(images):
-                combined.paste(img, (0, y_offset))
-                
-                # Add label if provided
-                if labels and i < len(labels):
-                    draw = ImageDraw.Draw(combined)
-                    draw.text((10, y_offset + 10), labels[i], fill="red")
-                
-                y_offset += img.height
+            # Pad narrower images on the right with white, then stack
+            max_width = max(a.shape[1] for a in arrays)
+            arrays = [
+                np.pad(a, ((0, 0), (0, max_width - a.shape[1]), (0, 0)), constant_values=255)
+                if a.shape[1] != max_width else a
+                for a in arrays
+            ]
+            combined = Image.fromarray(np.vstack(arrays))
+            offsets = np.cumsum([0] + [img.height for img in images[:-1]])
+            positions = [(10, int(y) + 10) for y in offsets]
+        
+        # Add labels if provided
+        if labels:
+            draw = ImageDraw.Draw(combined)
+            for label, position in zip(labels, positions):
+                draw.text(position, label, fill="red")
         
         return combined
 
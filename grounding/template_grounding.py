@@ -1,9 +1,13 @@
+import os
 from pathlib import Path
 from typing import Tuple, Optional
 from PIL import Image
+import cv2
 import numpy as np
 import config
-from grounding.base_grounding import BaseGrounding
+from grounding.base_grounding import BaseGrounding, GroundingContext
+from grounding._ncc_kernels import ncc_denominator, top_peaks
+from utils.buffer_pool import BufferPool
 
 try:
     from botcity.core import DesktopBot
@@ -11,18 +15,314 @@ try:
 except ImportError:
     BOTCITY_AVAILABLE = False
 
+try:
+    import pyfftw
+    import pyfftw.interfaces.numpy_fft as _fft
+    # Keep FFTW plans between calls; the screen size rarely changes
+    pyfftw.interfaces.cache.enable()
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.config.PLANNER_EFFORT = 'FFTW_MEASURE'
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    _fft = np.fft
+    PYFFTW_AVAILABLE = False
+
+try:
+    import torch
+    import torch.nn.functional as F
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+# Coarse-to-fine search: the coarsest template side is kept at or above
+# PYRAMID_MIN_TEMPLATE_SIZE, the best PYRAMID_TOP_K coarse peaks scoring at
+# least PYRAMID_COARSE_THRESHOLD are refined within +/- PYRAMID_SEARCH_RADIUS
+# pixels at each finer level
+PYRAMID_MIN_TEMPLATE_SIZE = 8
+PYRAMID_TOP_K = 5
+PYRAMID_COARSE_THRESHOLD = 0.5
+PYRAMID_SEARCH_RADIUS = 2
+
+# Sparse prescreen: PRESCREEN_SAMPLES template pixels (fixed seed) scored on
+# a PRESCREEN_STRIDE grid; the best PRESCREEN_TOP_K positions are verified
+PRESCREEN_SAMPLES = 128
+PRESCREEN_SEED = 0
+PRESCREEN_STRIDE = 4
+PRESCREEN_TOP_K = 10
+PRESCREEN_THRESHOLD = 0.4
+
+# Difference prescreen: squared differences on a 1/SAD_PRESCREEN_STRIDE image;
+# the SAD_PRESCREEN_TOP_K lowest are verified with NCC
+SAD_PRESCREEN_STRIDE = 4
+SAD_PRESCREEN_TOP_K = 10
+
+# GPU search: windows whose per-pixel variance (image scaled to [0, 1]) is
+# below this are treated as flat and score 0, as float32 cancellation there
+# would otherwise produce noise-over-noise scores
+CUDA_MIN_VARIANCE = 1e-5
+
+# Decoded grayscale templates shared across instances, keyed by
+# (absolute path, mtime, size) so edited files are decoded again
+_TEMPLATE_REGISTRY = {}
+
+# BotCity search budget: its find loop checks the elapsed time before each
+# capture-and-match attempt, so a short budget gives exactly one attempt
+# (0 can expire before the first one)
+BOTCITY_WAITING_TIME_MS = 50
+
+# Best score at which a failed match is still offered to later strategies
+# as a candidate region
+CANDIDATE_MIN_SCORE = 0.4
+
+
+def _to_gray(image: Image.Image) -> np.ndarray:
+    """PIL image as a float32 grayscale array."""
+    return np.asarray(image.convert('L'), dtype=np.float32)
+
+
+def _load_gray_template(path: Path) -> np.ndarray:
+    """
+    Grayscale template for a file, decoded once per file version.
+    
+    The returned array is shared between instances; do not modify it.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    template_gray = _TEMPLATE_REGISTRY.get(key)
+    if template_gray is None:
+        with Image.open(path) as template:
+            template_gray = _to_gray(template)
+        _TEMPLATE_REGISTRY[key] = template_gray
+    return template_gray
+
+
+def _build_pyramid(image: np.ndarray, levels: int) -> list:
+    """Gaussian pyramid [full, 1/2, 1/4, ...] with `levels` downsampled levels."""
+    pyramid = [image]
+    for _ in range(levels):
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return pyramid
+
+
+def _top_peaks(scores: np.ndarray, count: int, min_score: float, spacing: Tuple[int, int]) -> list:
+    """
+    Highest local peaks of a score map, suppressing neighbours of each pick.
+    
+    Returns:
+        Up to `count` (y, x) positions scoring at least min_score
+    """
+    half_h, half_w = max(spacing[0] // 2, 1), max(spacing[1] // 2, 1)
+    peaks = top_peaks(scores, count, float(min_score), half_h, half_w)
+    return [(int(y), int(x)) for y, x in peaks]
+
+
+def _refine(
+    image: np.ndarray,
+    template: np.ndarray,
+    y: int,
+    x: int,
+    radius: int
+) -> Tuple[float, Tuple[int, int]]:
+    """
+    Exact NCC search in a +/- radius neighbourhood of a top-left corner.
+    
+    Returns:
+        (score, (y, x) top-left corner) of the best position found
+    """
+    t_height, t_width = template.shape
+    max_y = image.shape[0] - t_height
+    max_x = image.shape[1] - t_width
+    y0 = min(max(y - radius, 0), max_y)
+    x0 = min(max(x - radius, 0), max_x)
+    y1 = min(y + radius, max_y)
+    x1 = min(x + radius, max_x)
+    
+    roi = image[y0:y1 + t_height, x0:x1 + t_width]
+    scores = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+    dy, dx = np.unravel_index(np.argmax(scores), scores.shape)
+    return float(scores[dy, dx]), (y0 + int(dy), x0 + int(dx))
+
+
+def _subsampled_prescreen(
+    image: np.ndarray,
+    offsets: Tuple[np.ndarray, np.ndarray],
+    values: np.ndarray,
+    template_shape: Tuple[int, int],
+    stride: int
+) -> np.ndarray:
+    """
+    Approximate NCC using only a fixed random subset of template pixels,
+    evaluated on a strided grid of positions.
+    
+    Args:
+        image: Grayscale float32 image
+        offsets: (dy, dx) arrays of the sampled template pixels
+        values: Sampled template values, zero-mean and unit-norm
+        template_shape: Full (th, tw) of the template
+        stride: Spacing of the evaluated positions
+    
+    Returns:
+        Score map over the grid; entry (i, j) is position (i*stride, j*stride)
+    """
+    rows = image.shape[0] - template_shape[0] + 1
+    cols = image.shape[1] - template_shape[1] + 1
+    grid_h = (rows + stride - 1) // stride
+    grid_w = (cols + stride - 1) // stride
+    
+    cross = np.zeros((grid_h, grid_w), dtype=np.float32)
+    total = np.zeros_like(cross)
+    total_sq = np.zeros_like(cross)
+    for dy, dx, value in zip(offsets[0], offsets[1], values):
+        samples = image[dy:dy + rows:stride, dx:dx + cols:stride]
+        cross += value * samples
+        total += samples
+        total_sq += samples * samples
+    
+    variance = np.maximum(total_sq - total * total / len(values), 0)
+    denom = np.sqrt(variance)
+    scores = np.zeros_like(cross)
+    np.divide(cross, denom, out=scores, where=denom > 1e-6)
+    return scores
+
+
+def _sad_prescreen(
+    image: np.ndarray,
+    template: np.ndarray,
+    stride: int,
+    count: int
+) -> list:
+    """
+    Cheap difference-based prescreen on a stride-decimated image.
+    
+    Args:
+        image: Full-resolution uint8 grayscale image
+        template: Template decimated by the same stride, uint8
+        stride: Decimation step
+        count: Number of candidates to return
+    
+    Returns:
+        Up to `count` full-resolution (y, x) top-left corners, best first
+    """
+    small = np.ascontiguousarray(image[::stride, ::stride])
+    if template.shape[0] > small.shape[0] or template.shape[1] > small.shape[1]:
+        return []
+    
+    diffs = cv2.matchTemplate(small, template, cv2.TM_SQDIFF)
+    # Lowest differences first: search for peaks of the negated map
+    peaks = _top_peaks(-diffs, count, -float(diffs.max()), template.shape)
+    return [(y * stride, x * stride) for y, x in peaks]
+
+
+def _ncc_cuda(
+    image: np.ndarray,
+    template_gpu: "torch.Tensor",
+    t_norm: float
+) -> Tuple[float, Tuple[int, int]]:
+    """
+    Exhaustive NCC search on the GPU; only the best score leaves the device.
+    
+    The numerator is a conv2d with the zero-mean template, the window
+    statistics come from box filters of the image and its square.
+    
+    Args:
+        image: Grayscale float32 image (H, W), 0-255
+        template_gpu: Zero-mean template scaled to [0, 1], shape (1, 1, th, tw)
+        t_norm: L2 norm of template_gpu
+    
+    Returns:
+        (score, (y, x) top-left corner)
+    """
+    t_height, t_width = template_gpu.shape[-2:]
+    with torch.inference_mode():
+        img = torch.from_numpy(image).to(template_gpu.device)[None, None] / 255.0
+        corr = F.conv2d(img, template_gpu)
+        mean = F.avg_pool2d(img, (t_height, t_width), stride=1)
+        mean_sq = F.avg_pool2d(img * img, (t_height, t_width), stride=1)
+        variance = (mean_sq - mean * mean).clamp_(min=0)
+        denom = torch.sqrt(variance * (t_height * t_width)) * t_norm
+        scores = torch.where(
+            variance > CUDA_MIN_VARIANCE,
+            corr / denom.clamp_(min=1e-12),
+            torch.zeros_like(corr)
+        )[0, 0]
+        index = int(torch.argmax(scores))
+        best = float(scores.view(-1)[index])
+    
+    y, x = divmod(index, scores.shape[1])
+    return best, (y, x)
+
+
+def _ncc_fft(
+    image: np.ndarray,
+    template: np.ndarray,
+    template_fft_conj: np.ndarray = None,
+    pool: BufferPool = None
+) -> np.ndarray:
+    """
+    Normalized cross-correlation of a template over an image, via FFT.
+    
+    Gives the same scores as cv2.TM_CCOEFF_NORMED: the numerator is a
+    frequency-domain correlation with the zero-mean template and the
+    denominator comes from summed-area tables of the image and its square.
+    
+    Args:
+        image: Grayscale float32 image (H, W)
+        template: Grayscale float32 template (th, tw), no larger than image
+        template_fft_conj: Optional precomputed conjugate rfft2 of the
+            zero-mean template padded to (H, W)
+        pool: Optional BufferPool for the summed-area tables and the score
+            map; the caller may put() the returned map back when done
+    
+    Returns:
+        (H - th + 1, W - tw + 1) score map in [-1, 1]
+    """
+    if pool is None:
+        pool = BufferPool()
+    
+    height, width = image.shape
+    t_height, t_width = template.shape
+    
+    t = template - template.mean()
+    t_norm = np.sqrt((t * t).sum())
+    if template_fft_conj is None:
+        template_fft_conj = np.conj(_fft.rfft2(t, s=(height, width)))
+    
+    spectrum = _fft.rfft2(image)
+    np.multiply(spectrum, template_fft_conj, out=spectrum)
+    corr = _fft.irfft2(spectrum, s=(height, width))
+    corr = corr[:height - t_height + 1, :width - t_width + 1]
+    
+    table_shape = (height + 1, width + 1)
+    sums = pool.get(table_shape, np.float64)
+    sq_sums = pool.get(table_shape, np.float64)
+    cv2.integral2(image, sums, sq_sums, cv2.CV_64F, cv2.CV_64F)
+    denom = ncc_denominator(sums, sq_sums, t_height, t_width, float(t_norm))
+    pool.put(sums)
+    pool.put(sq_sums)
+    
+    scores = pool.get(corr.shape, np.float64)
+    scores.fill(0)
+    np.divide(corr, denom, out=scores, where=denom > 1e-6)
+    return scores
+
 
 class TemplateGrounding(BaseGrounding):
     """
     Locate UI elements using template matching.
     Requires a reference image of the target element.
+    
+    Matching runs as an FFT-based normalized cross-correlation on the
+    supplied screenshot (as a conv2d on the GPU when CUDA is available and
+    config.TEMPLATE_USE_CUDA is set); BotCity's own capture-and-find is
+    used instead when use_fft is False.
     """
     
     def __init__(
         self,
         template_path: Path = None,
         threshold: float = None,
-        name: str = "TemplateMatching"
+        name: str = "TemplateMatching",
+        use_fft: bool = None
     ):
         """
         Initialize template grounding.
@@ -31,52 +331,301 @@ class TemplateGrounding(BaseGrounding):
             template_path: Path to template image
             threshold: Matching threshold (0-1), lower is more lenient
             name: Name for this strategy
+            use_fft: Match with FFT-based NCC instead of BotCity
+                (default: config.TEMPLATE_USE_FFT)
         """
         super().__init__(name)
         
-        if not BOTCITY_AVAILABLE:
+        self.use_fft = config.TEMPLATE_USE_FFT if use_fft is None else use_fft
+        
+        if not self.use_fft and not BOTCITY_AVAILABLE:
             self.logger.error("BotCity not installed. Install with: pip install botcity-core")
             raise ImportError("BotCity is required for template matching")
         
         self.template_path = template_path or config.TEMPLATE_PATH
         self.threshold = threshold or config.TEMPLATE_MATCH_THRESHOLD
         self.last_confidence = -1
-        
-        # Initialize BotCity
-        self.bot = DesktopBot()
+        self.template_name = "target_icon"
+        self.bot = None
         
         # Validate and load template
         if not self.template_path.exists():
             self.logger.error(f"Template not found: {self.template_path}")
             raise FileNotFoundError(f"Template not found: {self.template_path}")
         
-        # Register template with BotCity
-        template_name = "target_icon"
-        abs_path = self.template_path.absolute()
-        self.bot.add_image(template_name, str(abs_path))
-        self.template_name = template_name
+        self._load_template()
         
         self.logger.info(f"Loaded template from: {self.template_path}")
         self.logger.info(f"Matching threshold: {self.threshold}")
     
+    def _load_template(self):
+        """Prepare the current template for the active matching backend."""
+        if self.use_fft:
+            self.template_gray = _load_gray_template(self.template_path)
+            # Conjugated padded template FFTs keyed by (template, level, screen shape)
+            self._template_fft_cache = {}
+            # Scratch arrays reused across searches on same-sized screenshots
+            self._pool = BufferPool()
+            
+            # Stop downsampling before the template loses its detail
+            levels = 0
+            smallest = min(self.template_gray.shape)
+            while (levels < config.TEMPLATE_PYRAMID_LEVELS and
+                   smallest >> (levels + 1) >= PYRAMID_MIN_TEMPLATE_SIZE):
+                levels += 1
+            self.pyramid_levels = levels
+            self.template_pyramid = _build_pyramid(self.template_gray, levels)
+            
+            # Fixed (seeded) random subset of template pixels for the prescreen
+            rng = np.random.default_rng(PRESCREEN_SEED)
+            count = min(PRESCREEN_SAMPLES, self.template_gray.size)
+            picks = rng.choice(self.template_gray.size, count, replace=False)
+            self._prescreen_offsets = np.unravel_index(picks, self.template_gray.shape)
+            values = self.template_gray[self._prescreen_offsets]
+            values = values - values.mean()
+            norm = np.sqrt((values * values).sum())
+            self._prescreen_values = values / norm if norm > 1e-6 else values
+            
+            template_u8 = self.template_gray.astype(np.uint8)
+            self._sad_template = np.ascontiguousarray(
+                template_u8[::SAD_PRESCREEN_STRIDE, ::SAD_PRESCREEN_STRIDE]
+            )
+            
+            # Zero-mean template kept on the GPU for the exhaustive conv2d search
+            self._template_gpu = None
+            if config.TEMPLATE_USE_CUDA and TORCH_AVAILABLE and torch.cuda.is_available():
+                t = self.template_gray / 255.0
+                t = t - t.mean()
+                self._template_gpu = torch.from_numpy(t).cuda()[None, None]
+                self._template_gpu_norm = float(np.sqrt((t * t).sum()))
+                self.logger.info("Template matching on CUDA")
+            return
+        
+        # Register template with BotCity
+        if self.bot is None:
+            self.bot = DesktopBot()
+        abs_path = self.template_path.absolute()
+        self.bot.add_image(self.template_name, str(abs_path))
+    
+    def _score_map(self, image: np.ndarray, level: int = 0) -> np.ndarray:
+        """Full NCC map of the template pyramid level over an image."""
+        template = self.template_pyramid[level]
+        key = (str(self.template_path), level, image.shape)
+        template_fft_conj = self._template_fft_cache.get(key)
+        if template_fft_conj is None:
+            t = template - template.mean()
+            template_fft_conj = np.conj(_fft.rfft2(t, s=image.shape))
+            self._template_fft_cache[key] = template_fft_conj
+        
+        return _ncc_fft(image, template, template_fft_conj, self._pool)
+    
+    def _full_match(self, image: np.ndarray) -> Tuple[float, Tuple[int, int]]:
+        """Exhaustive search; returns (score, (y, x) top-left corner)."""
+        scores = self._score_map(image)
+        y, x = np.unravel_index(np.argmax(scores), scores.shape)
+        best = float(scores[y, x])
+        self._pool.put(scores)
+        return best, (int(y), int(x))
+    
+    def _pyramid_match(
+        self,
+        image: np.ndarray,
+        screen_pyramid: list = None
+    ) -> Optional[Tuple[float, Tuple[int, int]]]:
+        """
+        Coarse-to-fine search: full NCC at the coarsest level, then local
+        refinement around the best few peaks at each finer level.
+        
+        Returns:
+            (score, (y, x) top-left corner), or None if no coarse peak survives
+        """
+        if screen_pyramid is None:
+            screen_pyramid = _build_pyramid(image, self.pyramid_levels)
+        top = self.pyramid_levels
+        
+        coarse = screen_pyramid[top]
+        if any(t > c for t, c in zip(self.template_pyramid[top].shape, coarse.shape)):
+            return None
+        
+        coarse_scores = self._score_map(coarse, top)
+        candidates = _top_peaks(
+            coarse_scores,
+            PYRAMID_TOP_K,
+            PYRAMID_COARSE_THRESHOLD,
+            self.template_pyramid[top].shape
+        )
+        self._pool.put(coarse_scores)
+        
+        best = None
+        for level in range(top - 1, -1, -1):
+            level_image = screen_pyramid[level]
+            template = self.template_pyramid[level]
+            
+            # Search a small neighbourhood around each upsampled peak
+            refined = [
+                _refine(level_image, template, 2 * y, 2 * x, PYRAMID_SEARCH_RADIUS)
+                for y, x in candidates
+            ]
+            
+            refined.sort(reverse=True)
+            candidates = [position for _, position in refined]
+            best = refined[0] if refined else None
+        
+        return best
+    
+    def _prescreen_match(self, image: np.ndarray) -> Optional[Tuple[float, Tuple[int, int]]]:
+        """
+        Sparse prescreen over a strided grid, then exact NCC around the
+        best few candidates.
+        
+        Returns:
+            (score, (y, x) top-left corner), or None if nothing passes
+        """
+        scores = _subsampled_prescreen(
+            image,
+            self._prescreen_offsets,
+            self._prescreen_values,
+            self.template_gray.shape,
+            PRESCREEN_STRIDE
+        )
+        t_height, t_width = self.template_gray.shape
+        peaks = _top_peaks(
+            scores,
+            PRESCREEN_TOP_K,
+            PRESCREEN_THRESHOLD,
+            (t_height // PRESCREEN_STRIDE, t_width // PRESCREEN_STRIDE)
+        )
+        if not peaks:
+            return None
+        
+        return max(
+            _refine(image, self.template_gray, y * PRESCREEN_STRIDE, x * PRESCREEN_STRIDE,
+                    PRESCREEN_STRIDE)
+            for y, x in peaks
+        )
+    
+    def _sad_match(
+        self,
+        image: np.ndarray,
+        ctx: GroundingContext
+    ) -> Optional[Tuple[float, Tuple[int, int]]]:
+        """
+        Difference prescreen at 1/stride resolution, then exact NCC around
+        the best few candidates.
+        
+        Returns:
+            (score, (y, x) top-left corner), or None if nothing fits
+        """
+        candidates = _sad_prescreen(
+            ctx.gray,
+            self._sad_template,
+            SAD_PRESCREEN_STRIDE,
+            SAD_PRESCREEN_TOP_K
+        )
+        if not candidates:
+            return None
+        
+        return max(
+            _refine(image, self.template_gray, y, x, SAD_PRESCREEN_STRIDE)
+            for y, x in candidates
+        )
+    
+    def _best_match(
+        self,
+        screenshot: Image.Image,
+        min_score: float = None,
+        ctx: Optional[GroundingContext] = None
+    ) -> Tuple[float, Optional[Tuple[int, int]]]:
+        """
+        Find the highest-scoring template position in a screenshot.
+        
+        On CUDA the exhaustive search runs directly on the GPU. Otherwise
+        the sparse and difference prescreens (if enabled in config) and the
+        pyramid search are tried first; if none finds a position scoring at
+        least min_score, the exhaustive search runs so matches aren't lost.
+        
+        The grayscale screenshot and its pyramid are shared through ctx, so
+        other template strategies searching the same screenshot reuse them.
+        
+        Returns:
+            Tuple of (NCC score, (x, y) template center), or (-1, None) if
+            the template does not fit in the screenshot
+        """
+        if ctx is None or ctx.screenshot is not screenshot:
+            ctx = GroundingContext(screenshot)
+        image = ctx.cached(('gray',), lambda: ctx.gray.astype(np.float32))
+        t_height, t_width = self.template_gray.shape
+        if t_height > image.shape[0] or t_width > image.shape[1]:
+            self.logger.warning("Template is larger than the screenshot")
+            return -1.0, None
+        
+        if min_score is None:
+            min_score = self.threshold
+        
+        if self._template_gpu is not None:
+            score, (y, x) = _ncc_cuda(image, self._template_gpu, self._template_gpu_norm)
+            return score, (x + t_width // 2, y + t_height // 2)
+        
+        result = None
+        if config.PRESCREEN_ENABLED:
+            result = self._prescreen_match(image)
+        
+        if config.SAD_PRESCREEN_ENABLED and (result is None or result[0] < min_score):
+            result = self._sad_match(image, ctx)
+        
+        if self.pyramid_levels and (result is None or result[0] < min_score):
+            levels = self.pyramid_levels
+            screen_pyramid = ctx.cached(('pyramid', levels), lambda: _build_pyramid(image, levels))
+            result = self._pyramid_match(image, screen_pyramid)
+        
+        if result is None or result[0] < min_score:
+            if result is not None:
+                self.logger.debug("Fast template search inconclusive, running full search")
+            result = self._full_match(image)
+        
+        score, (y, x) = result
+        return score, (x + t_width // 2, y + t_height // 2)
+    
+    def _candidate_roi(
+        self,
+        coords: Tuple[int, int],
+        screenshot: Image.Image
+    ) -> Tuple[int, int, int, int]:
+        """Region around a near-miss, wide enough to include the icon's label."""
+        t_height, t_width = self.template_gray.shape
+        x, y = coords
+        left = max(0, x - t_width * 3 // 2)
+        top = max(0, y - t_height)
+        right = min(screenshot.width, x + t_width * 3 // 2)
+        bottom = min(screenshot.height, y + t_height * 2)
+        return left, top, right - left, bottom - top
+    
     def locate(
         self,
         screenshot: Image.Image,
         target: str,
-        threshold: float = None
+        threshold: float = None,
+        match: Tuple[float, Optional[Tuple[int, int]]] = None,
+        **kwargs
     ) -> Optional[Tuple[int, int]]:
         """
         Locate target using template matching.
         
         Args:
-            screenshot: PIL Image of screen (not used, BotCity captures internally)
+            screenshot: PIL Image of screen (not used with BotCity, which
+                captures internally)
             target: Target name (not used for template matching)
             threshold: Optional override for matching threshold
+            match: Precomputed (score, coords) from _best_match on this
+                screenshot, so only the threshold check is repeated
+            **kwargs: `ctx` GroundingContext to share preprocessing through;
+                others are ignored
         
         Returns:
             (x, y) coordinates of template center, or None if not found
         """
         match_threshold = threshold or self.threshold
+        self.last_candidates = []
         
         self.logger.debug(
             f"Searching for template '{self.template_name}' "
@@ -84,11 +633,30 @@ class TemplateGrounding(BaseGrounding):
         )
         
         try:
-            # BotCity's find method returns True/False
+            if self.use_fft:
+                score, coords = match or self._best_match(
+                    screenshot, match_threshold, kwargs.get('ctx')
+                )
+                self.last_confidence = max(score, 0.0)
+                
+                if coords is None or score < match_threshold:
+                    self.logger.debug(f"Template not found (best score: {score:.3f})")
+                    if coords is not None and score >= CANDIDATE_MIN_SCORE:
+                        self.last_candidates = [self._candidate_roi(coords, screenshot)]
+                    return None
+                
+                self.logger.info(
+                    f"✓ Template found at {coords} "
+                    f"[confidence: {self.last_confidence:.3f}]"
+                )
+                return coords
+            
+            # BotCity's find method returns True/False; single attempt, as
+            # callers retry with fresh screenshots themselves
             found = self.bot.find(
                 self.template_name,
                 matching=match_threshold,
-                waiting_time=2000  # 2 second timeout
+                waiting_time=BOTCITY_WAITING_TIME_MS
             )
             
             if not found:
@@ -146,10 +714,7 @@ class TemplateGrounding(BaseGrounding):
             raise FileNotFoundError(f"Template not found: {template_path}")
         
         self.template_path = template_path
-        
-        # Re-register with BotCity
-        abs_path = template_path.absolute()
-        self.bot.add_image(self.template_name, str(abs_path))
+        self._load_template()
         
         self.logger.info(f"Updated template to: {template_path}")
 
@@ -196,10 +761,22 @@ class AdaptiveTemplateGrounding(TemplateGrounding):
         """
         self.logger.debug(f"Trying {len(self.thresholds)} threshold levels")
         
+        # The NCC map doesn't depend on the threshold, so correlate only once
+        match = None
+        if self.use_fft:
+            try:
+                match = self._best_match(
+                    screenshot, min(self.thresholds), kwargs.get('ctx')
+                )
+            except Exception as e:
+                self.logger.error(f"Template matching error: {e}")
+                self.last_confidence = -1
+                return None
+        
         for i, threshold in enumerate(self.thresholds, 1):
             self.logger.debug(f"Attempt {i}/{len(self.thresholds)}: threshold={threshold}")
             
-            coords = super().locate(screenshot, target, threshold=threshold)
+            coords = super().locate(screenshot, target, threshold=threshold, match=match)
             
             if coords:
                 self.logger.info(
@@ -1,7 +1,10 @@
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 import config
 from utils import setup_file_logger
 from utils.retry import retry_on_exception
@@ -17,6 +20,10 @@ from grounding import (
 # Set up logging
 logger = setup_file_logger(__name__, level=config.LOG_LEVEL)
 
+# Half-size of the desktop patch around the cached icon that must be
+# unchanged for the cached position to be reused
+ICON_CACHE_PATCH_RADIUS = 32
+
 
 class DesktopAutomationWorkflow:
     """
@@ -54,6 +61,16 @@ class DesktopAutomationWorkflow:
         # 4. Grounding System - Multi-strategy with fallbacks
         self.grounding_system = self._setup_grounding()
         
+        # Last grounded icon position and the desktop patch around it
+        self._icon_cache = None
+        self._icon_patch = None
+        
+        # Grounds the next post's icon while the current post wraps up
+        self._prefetch_pool = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="icon-prefetch")
+            if config.PIPELINE_CAPTURE else None
+        )
+        
         logger.info("✓ All components initialized")
         logger.info("=" * 70)
     
@@ -106,6 +123,13 @@ class DesktopAutomationWorkflow:
         logger.info("=" * 70)
         return grounding
     
+    @staticmethod
+    def _patch_around(gray: np.ndarray, coords: tuple) -> np.ndarray:
+        """Grayscale patch of +/- ICON_CACHE_PATCH_RADIUS pixels around coords."""
+        x, y = coords
+        r = ICON_CACHE_PATCH_RADIUS
+        return gray[max(0, y - r):y + r, max(0, x - r):x + r].astype(np.float32)
+    
     @retry_on_exception(max_attempts=config.MAX_GROUNDING_ATTEMPTS, delay=config.GROUNDING_RETRY_DELAY)
     def locate_notepad_icon(self) -> tuple:
         """
@@ -118,15 +142,26 @@ class DesktopAutomationWorkflow:
             RuntimeError: If icon cannot be located after all retries
         """
         logger.info("Capturing desktop screenshot...")
-        screenshot = self.screen_capture.capture_screen()
+        frame = self.screen_capture.capture_frame()
+        screenshot = frame.pil_rgb
+        
+        # Skip grounding when the pixels under the cached icon are unchanged
+        if self._icon_cache is not None and not config.FORCE_REGROUND:
+            patch = self._patch_around(frame.np_gray, self._icon_cache)
+            if (patch.shape == self._icon_patch.shape and
+                    np.abs(patch - self._icon_patch).mean() <= config.ICON_CACHE_DIFF_THRESHOLD):
+                logger.info(f"✓ Icon area unchanged, reusing Notepad icon at {self._icon_cache}")
+                return self._icon_cache, screenshot
         
         logger.info("Searching for Notepad icon...")
-        coords = self.grounding_system.locate(screenshot, "Notepad")
+        coords = self.grounding_system.locate(frame, "Notepad")
         
         if not coords:
             raise RuntimeError("Could not locate Notepad icon")
         
         logger.info(f"✓ Notepad icon located at {coords}")
+        self._icon_cache = coords
+        self._icon_patch = self._patch_around(frame.np_gray, coords)
         
         # Save debug screenshot if enabled
         if config.SAVE_DEBUG_SCREENSHOTS:
@@ -134,7 +169,8 @@ class DesktopAutomationWorkflow:
                 screenshot,
                 coords,
                 label="Notepad Icon",
-                prefix="notepad_grounding"
+                prefix="notepad_grounding",
+                inplace=True
             )
         
         return coords, screenshot
@@ -161,55 +197,71 @@ class DesktopAutomationWorkflow:
             'failed_posts': []
         }
         
-        for i, post in enumerate(posts, 1):
-            post_id = post['id']
-            filename = f"post_{post_id}.txt"
-            filepath = config.OUTPUT_DIR / filename
-            
-            logger.info("")
-            logger.info(f"[{i}/{len(posts)}] Processing Post ID: {post_id}")
-            logger.info(f"  Title: {post['title']}")
-            logger.info(f"  Filename: {filename}")
-            
-            # Check if file already exists
-            if filepath.exists():
-                logger.info(f"  File exists, removing: {filepath}")
-                filepath.unlink()
-            
-            try:
-                # 1. Locate Notepad icon (fresh screenshot each time)
-                logger.info("  Step 1: Locating Notepad icon...")
-                coords, screenshot = self.locate_notepad_icon()
+        contents, filenames = self.api_client.prepare_batch(posts)
+        next_icon = None
+        
+        try:
+            for i, (post, content, filename) in enumerate(zip(posts, contents, filenames), 1):
+                post_id = post['id']
+                filepath = config.OUTPUT_DIR / filename
                 
-                # 2. Prepare content
-                content = self.api_client.format_post_content(post)
+                logger.info("")
+                logger.info(f"[{i}/{len(posts)}] Processing Post ID: {post_id}")
+                logger.info(f"  Title: {post['title']}")
+                logger.info(f"  Filename: {filename}")
                 
-                # 3. Execute Notepad workflow
-                logger.info("  Step 2: Executing Notepad workflow...")
-                success = self.notepad_controller.write_post_to_file(
-                    content=content,
-                    filepath=filepath,
-                    coords=coords
-                )
+                # Check if file already exists
+                if filepath.exists():
+                    logger.info(f"  File exists, removing: {filepath}")
+                    filepath.unlink()
                 
-                if success:
-                    stats['successful'] += 1
-                    logger.info(f"  ✓ Post {post_id} completed successfully")
-                else:
+                try:
+                    # 1. Locate Notepad icon (re-grounded only if the desktop changed)
+                    logger.info("  Step 1: Locating Notepad icon...")
+                    if next_icon is not None:
+                        future, next_icon = next_icon, None
+                        coords, screenshot = future.result()
+                    else:
+                        coords, screenshot = self.locate_notepad_icon()
+                    
+                    # 2. Execute Notepad workflow
+                    logger.info("  Step 2: Executing Notepad workflow...")
+                    success = self.notepad_controller.write_post_to_file(
+                        content=content,
+                        filepath=filepath,
+                        coords=coords
+                    )
+                    
+                    if success:
+                        # Notepad is closed again; capture and ground for the
+                        # next post while this one wraps up and the delay runs
+                        if self._prefetch_pool is not None and i < len(posts):
+                            next_icon = self._prefetch_pool.submit(self.locate_notepad_icon)
+                        stats['successful'] += 1
+                        logger.info(f"  ✓ Post {post_id} completed successfully")
+                    else:
+                        stats['failed'] += 1
+                        stats['failed_posts'].append(post_id)
+                        logger.error(f"  ✗ Post {post_id} failed")
+                        # The icon may have moved; ground again next time
+                        self._icon_cache = None
+                    
+                    # Small delay between posts
+                    time.sleep(0.5)
+                    
+                except Exception as e:
                     stats['failed'] += 1
                     stats['failed_posts'].append(post_id)
-                    logger.error(f"  ✗ Post {post_id} failed")
-                
-                # Small delay between posts
-                time.sleep(0.5)
-                
-            except Exception as e:
-                stats['failed'] += 1
-                stats['failed_posts'].append(post_id)
-                logger.error(f"  ✗ Post {post_id} failed with exception: {e}")
-                
-                # Cleanup on error
-                self.notepad_controller.cleanup_all_notepad_windows()
+                    logger.error(f"  ✗ Post {post_id} failed with exception: {e}")
+                    self._icon_cache = None
+                    
+                    # Cleanup on error
+                    self.notepad_controller.cleanup_all_notepad_windows()
+            
+        finally:
+            # Drop a prefetch left unconsumed by an interrupt
+            if next_icon is not None:
+                next_icon.cancel()
         
         return stats
     
@@ -222,14 +274,17 @@ class DesktopAutomationWorkflow:
         """
         posts_count = posts_count or config.POSTS_COUNT
         
+        # Fetch in the background while we wait for the user to get ready
+        logger.info("Fetching blog posts...")
+        posts_future = self.api_client.fetch_posts_async(count=posts_count)
+        
         logger.info(f"Starting automation workflow in {config.STARTUP_DELAY} seconds...")
         logger.info("Please ensure Notepad shortcut is on desktop!")
         time.sleep(config.STARTUP_DELAY)
         
         try:
-            # 1. Fetch posts
-            logger.info("Fetching blog posts...")
-            posts = self.api_client.fetch_posts_with_fallback(count=posts_count)
+            # 1. Collect fetched posts
+            posts = posts_future.result()
             logger.info(f"✓ Retrieved {len(posts)} posts")
             
             # 2. Validate posts
@@ -266,6 +321,10 @@ class DesktopAutomationWorkflow:
             logger.exception("Workflow failed with unexpected error")
             self.notepad_controller.cleanup_all_notepad_windows()
             raise
+        
+        finally:
+            if self._prefetch_pool is not None:
+                self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
 
 
 def main():
@@ -1,12 +1,23 @@
 from .logger import setup_logger, setup_file_logger, LoggerMixin
-from .retry import retry_on_exception, RetryContext, retry_function
+from .retry import (
+    retry_on_exception,
+    RetryContext,
+    retry_function,
+    aretry_on_exception,
+    aretry_function
+)
+from .buffer_pool import BufferPool
 from .validators import (
     validate_coordinates,
+    validate_coordinates_batch,
     validate_file_path,
+    validate_file_paths,
     find_window_by_title,
+    invalidate_window_cache,
     wait_for_window,
     verify_window_active,
-    get_screen_size
+    get_screen_size,
+    invalidate_screen_size_cache
 )
 
 __all__ = [
@@ -19,12 +30,21 @@ __all__ = [
     'retry_on_exception',
     'RetryContext',
     'retry_function',
+    'aretry_on_exception',
+    'aretry_function',
+    
+    # Buffers
+    'BufferPool',
     
     # Validators
     'validate_coordinates',
+    'validate_coordinates_batch',
     'validate_file_path',
+    'validate_file_paths',
     'find_window_by_title',
+    'invalidate_window_cache',
     'wait_for_window',
     'verify_window_active',
     'get_screen_size',
+    'invalidate_screen_size_cache',
 ]
\ No newline at end of file
@@ -0,0 +1,44 @@
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+class BufferPool:
+    """
+    Reusable numpy arrays keyed by (shape, dtype).
+    
+    Repeated image processing on same-sized screenshots can take scratch
+    arrays from the pool and hand them back when done, instead of
+    allocating large temporaries on every call.
+    """
+    
+    def __init__(self, max_per_key: int = 2):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            max_per_key: Maximum number of idle arrays kept per (shape, dtype)
+        """
+        self.max_per_key = max_per_key
+        self._pool: Dict[Tuple[tuple, np.dtype], List[np.ndarray]] = {}
+    
+    def get(self, shape: tuple, dtype=np.float64) -> np.ndarray:
+        """
+        Take an array from the pool, or allocate one if none is idle.
+        
+        Contents are undefined; callers must overwrite or fill it.
+        """
+        key = (tuple(shape), np.dtype(dtype))
+        buffers = self._pool.get(key)
+        if buffers:
+            return buffers.pop()
+        return np.empty(shape, dtype)
+    
+    def put(self, array: np.ndarray):
+        """Return an array to the pool for later reuse."""
+        buffers = self._pool.setdefault((array.shape, array.dtype), [])
+        if len(buffers) < self.max_per_key:
+            buffers.append(array)
+    
+    def clear(self):
+        """Drop all pooled arrays."""
+        self._pool.clear()
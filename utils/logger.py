@@ -1,87 +1,153 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 import config
 
+# Level names resolved to logging constants, e.g. {'info': 20}
+_LEVEL_CACHE = {}
 
-def setup_logger(name: str, level: str = None) -> logging.Logger:
+# Shared by every handler using the project log format
+_DEFAULT_FORMATTER = logging.Formatter(config.LOG_FORMAT)
+
+# LoggerMixin loggers, one per class
+_CLASS_LOGGERS = {}
+
+
+def _lvl(level: str) -> int:
+    """Resolve a level name such as 'INFO' to its logging constant."""
+    value = _LEVEL_CACHE.get(level)
+    if value is None:
+        value = _LEVEL_CACHE[level] = getattr(logging, level.upper())
+    return value
+
+
+class _BlockingQueueHandler(QueueHandler):
+    """QueueHandler that waits for space in a bounded queue instead of failing."""
+    
+    def __init__(self, log_queue: queue.Queue, log_file: str):
+        super().__init__(log_queue)
+        # Target file of the listener behind this queue, to detect duplicates
+        self.log_file = log_file
+    
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put(record)
+
+
+def _file_queue_handler(log_file: Path, level: int, queue_size: int) -> QueueHandler:
+    """
+    Queue handler feeding a background listener that owns a FileHandler.
+    
+    The listener is stopped (and the queue flushed) at interpreter exit.
+    """
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setLevel(level)
+    file_handler.setFormatter(_DEFAULT_FORMATTER)
+    
+    log_queue = queue.Queue(maxsize=queue_size)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    return _BlockingQueueHandler(log_queue, str(log_file))
+
+
+def setup_logger(
+    name: str,
+    level: str = None,
+    log_file: Path = None,
+    queue_size: int = 0
+) -> logging.Logger:
     """
     Set up a logger with consistent formatting.
     
+    With log_file, records also go to that file. File writes happen on a
+    background listener thread: logging calls only enqueue the record.
+    Repeated calls don't add a second console or same-file handler.
+    
     Args:
         name: Name of the logger (usually __name__ from calling module)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: Optional path of a log file to write to as well
+        queue_size: Maximum queued file records before logging calls block
+            (0 = unbounded)
     
     Returns:
         Configured logger instance
     """
     if level is None:
         level = config.LOG_LEVEL
+    level_no = _lvl(level)
     
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(level_no)
+    handlers = logger.handlers
     
     # Avoid adding handlers multiple times
-    if not logger.handlers:
+    if not handlers:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-        
-        # Formatter
-        formatter = logging.Formatter(config.LOG_FORMAT)
-        console_handler.setFormatter(formatter)
+        console_handler.setLevel(level_no)
+        console_handler.setFormatter(_DEFAULT_FORMATTER)
         
         logger.addHandler(console_handler)
     
+    if log_file is not None and not any(
+        getattr(handler, 'log_file', None) == str(log_file) for handler in handlers
+    ):
+        logger.addHandler(_file_queue_handler(log_file, level_no, queue_size))
+    
     return logger
 
 
-def setup_file_logger(name: str, log_file: Path = None, level: str = None) -> logging.Logger:
+def setup_file_logger(
+    name: str,
+    log_file: Path = None,
+    level: str = None,
+    queue_size: int = 0
+) -> logging.Logger:
     """
     Set up a logger that writes to both console and file.
     
+    Same as setup_logger with a log file, defaulting to a timestamped file
+    under logs/.
+    
     Args:
         name: Name of the logger
         log_file: Path to log file (default: logs/automation_YYYYMMDD_HHMMSS.log)
         level: Logging level
+        queue_size: Maximum queued records before logging calls block
+            (0 = unbounded)
     
     Returns:
         Configured logger instance
     """
-    if level is None:
-        level = config.LOG_LEVEL
-    
-    logger = setup_logger(name, level)
-    
-    # File handler
     if log_file is None:
         logs_dir = config.PROJECT_ROOT / "logs"
         logs_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = logs_dir / f"automation_{timestamp}.log"
     
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(getattr(logging, level.upper()))
-    
-    formatter = logging.Formatter(config.LOG_FORMAT)
-    file_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    
-    return logger
+    return setup_logger(name, level, log_file, queue_size)
 
 
 class LoggerMixin:
     """
     Mixin class to add logger property to any class.
     Usage: class MyClass(LoggerMixin): ...
+    
+    The logger is named after the class and shared by all its instances.
     """
     @property
     def logger(self) -> logging.Logger:
-        if not hasattr(self, '_logger'):
-            self._logger = setup_logger(self.__class__.__name__)
-        return self._logger
+        cls = type(self)
+        logger = _CLASS_LOGGERS.get(cls)
+        if logger is None:
+            logger = _CLASS_LOGGERS[cls] = setup_logger(cls.__name__)
+        return logger
 
 
 if __name__ == "__main__":
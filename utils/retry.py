@@ -1,17 +1,66 @@
 import time
+import random
+import asyncio
 import functools
-from typing import Callable, Type, Tuple, Any
+from typing import Callable, Type, Tuple, Any, Optional
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+JITTER_MODES = (None, "full", "equal", "decorrelated")
+
+
+def _check_jitter(jitter: Optional[str]):
+    """Raise ValueError for an unknown jitter mode."""
+    if jitter not in JITTER_MODES:
+        raise ValueError(f"jitter must be one of {JITTER_MODES}, got {jitter!r}")
+
+
+def _func_name(func: Callable) -> str:
+    """Name used for func in log messages (works for partials and other callables)."""
+    return getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or repr(func)
+
+
+def _backoff_delay(
+    delay: float,
+    backoff: float,
+    attempt: int,
+    cap: float,
+    jitter: Optional[str],
+    previous: float
+) -> float:
+    """
+    Return the delay before the retry following failed attempt `attempt` (1-based).
+    
+    Args:
+        delay: Initial delay
+        backoff: Delay multiplier per attempt
+        attempt: Number of the attempt that just failed
+        cap: Upper bound on any sleep
+        jitter: None (deterministic), "full", "equal" or "decorrelated"
+        previous: Previous sleep (used by decorrelated jitter)
+    
+    Returns:
+        Seconds to sleep
+    """
+    exp = min(cap, delay * backoff ** (attempt - 1))
+    if jitter == "full":
+        return random.uniform(0, exp)
+    if jitter == "equal":
+        return exp / 2 + random.uniform(0, exp / 2)
+    if jitter == "decorrelated":
+        return min(cap, random.uniform(delay, previous * 3))
+    return exp
+
 
 def retry_on_exception(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 1.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    on_retry: Callable = None
+    on_retry: Callable = None,
+    cap: float = 60.0,
+    jitter: Optional[str] = None
 ):
     """
     Decorator to retry a function on exception.
@@ -22,6 +71,10 @@ def retry_on_exception(
         backoff: Multiplier for delay after each retry (1.0 = constant)
         exceptions: Tuple of exception types to catch
         on_retry: Optional callback function called on each retry
+        cap: Maximum delay between retries in seconds
+        jitter: Randomize delays so concurrent callers don't retry in
+            lockstep: "full" (0..delay), "equal" (delay/2..delay),
+            "decorrelated" (delay..3x previous), or None for fixed delays
     
     Example:
         @retry_on_exception(max_attempts=3, delay=1, backoff=2)
@@ -29,7 +82,21 @@ def retry_on_exception(
             # might fail
             pass
     """
+    _check_jitter(jitter)
+    
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            # time.sleep would block the event loop for the whole backoff
+            raise TypeError(
+                f"{func.__name__} is a coroutine function; use aretry_on_exception"
+            )
+        
+        # Nothing to retry: call the function directly
+        if max_attempts <= 1:
+            return func
+        
+        fname = _func_name(func)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             current_delay = delay
@@ -37,11 +104,11 @@ def retry_on_exception(
             
             for attempt in range(1, max_attempts + 1):
                 try:
-                    logger.debug(f"Attempt {attempt}/{max_attempts} for {func.__name__}")
+                    logger.debug("Attempt %d/%d for %s", attempt, max_attempts, fname)
                     result = func(*args, **kwargs)
                     
                     if attempt > 1:
-                        logger.info(f"✓ {func.__name__} succeeded on attempt {attempt}")
+                        logger.info("✓ %s succeeded on attempt %d", fname, attempt)
                     
                     return result
                     
@@ -50,18 +117,94 @@ def retry_on_exception(
                     
                     if attempt < max_attempts:
                         logger.warning(
-                            f"✗ {func.__name__} failed (attempt {attempt}/{max_attempts}): {e}"
+                            "✗ %s failed (attempt %d/%d): %s",
+                            fname, attempt, max_attempts, e
                         )
                         
                         if on_retry:
                             on_retry(attempt, e)
                         
-                        logger.info(f"Retrying in {current_delay:.1f}s...")
+                        current_delay = _backoff_delay(
+                            delay, backoff, attempt, cap, jitter, current_delay
+                        )
+                        logger.info("Retrying in %.1fs...", current_delay)
                         time.sleep(current_delay)
-                        current_delay *= backoff
                     else:
-                        logger.error(
-                            f"✗ {func.__name__} failed after {max_attempts} attempts"
+                        logger.exception(
+                            "✗ %s failed after %d attempts", fname, max_attempts
+                        )
+            
+            # All attempts exhausted
+            raise last_exception
+        
+        return wrapper
+    return decorator
+
+
+def aretry_on_exception(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 1.0,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    on_retry: Callable = None,
+    cap: float = 60.0,
+    jitter: Optional[str] = None
+):
+    """
+    Async version of retry_on_exception for coroutine functions.
+    
+    Waits with asyncio.sleep, so other tasks keep running during backoff.
+    Arguments are the same as retry_on_exception.
+    
+    Example:
+        @aretry_on_exception(max_attempts=3, delay=1, backoff=2)
+        async def unreliable_coroutine():
+            # might fail
+            pass
+    """
+    _check_jitter(jitter)
+    
+    def decorator(func):
+        if max_attempts <= 1:
+            return func
+        
+        fname = _func_name(func)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            current_delay = delay
+            last_exception = None
+            
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    logger.debug("Attempt %d/%d for %s", attempt, max_attempts, fname)
+                    result = await func(*args, **kwargs)
+                    
+                    if attempt > 1:
+                        logger.info("✓ %s succeeded on attempt %d", fname, attempt)
+                    
+                    return result
+                    
+                except exceptions as e:
+                    last_exception = e
+                    
+                    if attempt < max_attempts:
+                        logger.warning(
+                            "✗ %s failed (attempt %d/%d): %s",
+                            fname, attempt, max_attempts, e
+                        )
+                        
+                        if on_retry:
+                            on_retry(attempt, e)
+                        
+                        current_delay = _backoff_delay(
+                            delay, backoff, attempt, cap, jitter, current_delay
+                        )
+                        logger.info("Retrying in %.1fs...", current_delay)
+                        await asyncio.sleep(current_delay)
+                    else:
+                        logger.exception(
+                            "✗ %s failed after %d attempts", fname, max_attempts
                         )
             
             # All attempts exhausted
@@ -75,6 +218,9 @@ class RetryContext:
     """
     Context manager for manual retry logic.
     
+    Iterating yields attempt numbers and sleeps (with backoff and jitter)
+    before every attempt after the first; should_retry only decides.
+    
     Example:
         with RetryContext(max_attempts=3, delay=1) as retry:
             for attempt in retry:
@@ -90,12 +236,17 @@ class RetryContext:
         max_attempts: int = 3,
         delay: float = 1.0,
         backoff: float = 1.0,
-        exceptions: Tuple[Type[Exception], ...] = (Exception,)
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        cap: float = 60.0,
+        jitter: Optional[str] = None
     ):
+        _check_jitter(jitter)
         self.max_attempts = max_attempts
         self.initial_delay = delay
         self.backoff = backoff
         self.exceptions = exceptions
+        self.cap = cap
+        self.jitter = jitter
         self.current_attempt = 0
         self.current_delay = delay
     
@@ -107,24 +258,25 @@ class RetryContext:
     
     def __iter__(self):
         for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                self.current_delay = _backoff_delay(
+                    self.initial_delay, self.backoff, attempt - 1,
+                    self.cap, self.jitter, self.current_delay
+                )
+                logger.info("Retrying in %.1fs...", self.current_delay)
+                time.sleep(self.current_delay)
+            
             self.current_attempt = attempt
             yield attempt
     
     def should_retry(self, exception: Exception) -> bool:
-        """Check if we should retry after this exception."""
-        if not isinstance(exception, self.exceptions):
-            return False
-        
-        if self.current_attempt >= self.max_attempts:
+        """Check if we should retry after this exception; the next iteration waits."""
+        if not isinstance(exception, self.exceptions) or self.current_attempt >= self.max_attempts:
             return False
         
         logger.warning(
-            f"Attempt {self.current_attempt}/{self.max_attempts} failed: {exception}"
+            "Attempt %d/%d failed: %s", self.current_attempt, self.max_attempts, exception
         )
-        logger.info(f"Retrying in {self.current_delay:.1f}s...")
-        time.sleep(self.current_delay)
-        self.current_delay *= self.backoff
-        
         return True
 
 
@@ -135,7 +287,9 @@ def retry_function(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 1.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    cap: float = 60.0,
+    jitter: Optional[str] = None
 ) -> Any:
     """
     Retry a function without using a decorator.
@@ -148,6 +302,8 @@ def retry_function(
         delay: Initial delay between retries
         backoff: Delay multiplier after each retry
         exceptions: Exception types to catch
+        cap: Maximum delay between retries
+        jitter: None, "full", "equal" or "decorrelated" (see retry_on_exception)
     
     Returns:
         Result of successful function call
@@ -155,9 +311,11 @@ def retry_function(
     Raises:
         Last exception if all attempts fail
     """
+    _check_jitter(jitter)
     if kwargs is None:
         kwargs = {}
     
+    fname = _func_name(func)
     current_delay = delay
     last_exception = None
     
@@ -169,10 +327,57 @@ def retry_function(
             
             if attempt < max_attempts:
                 logger.warning(
-                    f"{func.__name__} failed (attempt {attempt}/{max_attempts}): {e}"
+                    "%s failed (attempt %d/%d): %s",
+                    fname, attempt, max_attempts, e
+                )
+                current_delay = _backoff_delay(
+                    delay, backoff, attempt, cap, jitter, current_delay
                 )
                 time.sleep(current_delay)
-                current_delay *= backoff
+    
+    raise last_exception
+
+
+async def aretry_function(
+    func: Callable,
+    args: tuple = (),
+    kwargs: dict = None,
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 1.0,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    cap: float = 60.0,
+    jitter: Optional[str] = None
+) -> Any:
+    """
+    Async version of retry_function: awaits func and sleeps with asyncio.sleep.
+    
+    Arguments, return value and exceptions are the same as retry_function;
+    func must be a coroutine function.
+    """
+    _check_jitter(jitter)
+    if kwargs is None:
+        kwargs = {}
+    
+    fname = _func_name(func)
+    current_delay = delay
+    last_exception = None
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except exceptions as e:
+            last_exception = e
+            
+            if attempt < max_attempts:
+                logger.warning(
+                    "%s failed (attempt %d/%d): %s",
+                    fname, attempt, max_attempts, e
+                )
+                current_delay = _backoff_delay(
+                    delay, backoff, attempt, cap, jitter, current_delay
+                )
+                await asyncio.sleep(current_delay)
     
     raise last_exception
 
@@ -1,25 +1,85 @@
+import ctypes
+import functools
+import os
+import random
+import re
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+import numpy as np
 import pygetwindow as gw
 from utils.logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
+# Win32 event hook constants (see WinUser.h)
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+WM_QUIT = 0x0012
 
-def validate_coordinates(x: int, y: int, screen_width: int = 1920, screen_height: int = 1080) -> bool:
+# find_window_by_title polling: the interval starts at WINDOW_POLL_INITIAL,
+# doubles each round up to WINDOW_POLL_MAX, and is jittered by +/-50%
+WINDOW_POLL_INITIAL = 0.05
+WINDOW_POLL_MAX = 0.4
+
+# Cached (width, height) from get_screen_size
+_SCREEN_SIZE: Optional[Tuple[int, int]] = None
+
+# Top-level window list shared by back-to-back lookups for WINDOW_LIST_TTL seconds
+WINDOW_LIST_TTL = 0.1
+_WINDOW_LIST: list = []
+_WINDOW_LIST_TIME = float('-inf')
+
+# Directories seen to exist, trusted for DIR_EXISTS_TTL seconds
+DIR_EXISTS_TTL = 1.0
+_DIR_EXISTS: Dict[str, float] = {}
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+    
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    
+    WinEventProcType = ctypes.WINFUNCTYPE(
+        None,
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.HWND,
+        wintypes.LONG,
+        wintypes.LONG,
+        wintypes.DWORD,
+        wintypes.DWORD
+    )
+else:
+    _user32 = None
+
+
+def validate_coordinates(x: int, y: int, screen_width: int = None, screen_height: int = None) -> bool:
     """
     Validate that coordinates are within screen bounds.
     
     Args:
         x: X coordinate
         y: Y coordinate
-        screen_width: Screen width in pixels
-        screen_height: Screen height in pixels
+        screen_width: Screen width in pixels (default: actual screen width)
+        screen_height: Screen height in pixels (default: actual screen height)
     
     Returns:
         True if coordinates are valid
     """
+    if screen_width is None or screen_height is None:
+        width, height = get_screen_size()
+        screen_width = screen_width or width
+        screen_height = screen_height or height
+    
     if not (0 <= x < screen_width):
         logger.warning(f"X coordinate {x} is out of bounds (0-{screen_width})")
         return False
@@ -31,6 +91,58 @@ def validate_coordinates(x: int, y: int, screen_width: int = 1920, screen_height
     return True
 
 
+def validate_coordinates_batch(
+    xy: np.ndarray,
+    screen_width: int = None,
+    screen_height: int = None
+) -> np.ndarray:
+    """
+    Validate many coordinates against screen bounds in one pass.
+    
+    Logs a single aggregate warning instead of one per point; use
+    np.where(~mask) to find the offending rows.
+    
+    Args:
+        xy: (N, 2) array of (x, y) coordinates
+        screen_width: Screen width in pixels (default: actual screen width)
+        screen_height: Screen height in pixels (default: actual screen height)
+    
+    Returns:
+        (N,) boolean mask, True where the coordinate is valid
+    """
+    if screen_width is None or screen_height is None:
+        width, height = get_screen_size()
+        screen_width = screen_width or width
+        screen_height = screen_height or height
+    
+    xy = np.asarray(xy).reshape(-1, 2)
+    x, y = xy[:, 0], xy[:, 1]
+    mask = (x >= 0) & (x < screen_width) & (y >= 0) & (y < screen_height)
+    
+    invalid = len(mask) - int(np.count_nonzero(mask))
+    if invalid:
+        logger.warning(
+            f"{invalid}/{len(mask)} coordinates out of bounds "
+            f"(0-{screen_width}, 0-{screen_height})"
+        )
+    
+    return mask
+
+
+def _dir_exists(directory: str) -> bool:
+    """os.path.isdir, with hits cached briefly; misses are always re-checked."""
+    now = time.monotonic()
+    seen = _DIR_EXISTS.get(directory)
+    if seen is not None and now - seen < DIR_EXISTS_TTL:
+        return True
+    
+    if not os.path.isdir(directory):
+        _DIR_EXISTS.pop(directory, None)
+        return False
+    _DIR_EXISTS[directory] = now
+    return True
+
+
 def validate_file_path(path: Path, must_exist: bool = False) -> bool:
     """
     Validate a file path.
@@ -43,15 +155,16 @@ def validate_file_path(path: Path, must_exist: bool = False) -> bool:
         True if path is valid
     """
     try:
-        path = Path(path)
+        path = os.fspath(path)
         
-        if must_exist and not path.exists():
+        if must_exist and not os.path.exists(path):
             logger.error(f"Path does not exist: {path}")
             return False
         
         # Check if parent directory exists (or can be created)
-        if not path.parent.exists():
-            logger.warning(f"Parent directory does not exist: {path.parent}")
+        parent = os.path.dirname(os.path.abspath(path))
+        if not _dir_exists(parent):
+            logger.warning(f"Parent directory does not exist: {parent}")
             return False
         
         return True
@@ -61,70 +174,287 @@ def validate_file_path(path: Path, must_exist: bool = False) -> bool:
         return False
 
 
+def validate_file_paths(paths: Iterable[Path], must_exist: bool = False) -> List[bool]:
+    """
+    Validate many file paths, checking each parent directory once.
+    
+    Args:
+        paths: Paths to validate
+        must_exist: If True, each path must exist
+    
+    Returns:
+        One bool per path, as validate_file_path would return
+    """
+    parents: Dict[str, bool] = {}
+    results = []
+    
+    for path in paths:
+        path = os.fspath(path)
+        parent = os.path.dirname(os.path.abspath(path))
+        if parent not in parents:
+            parents[parent] = _dir_exists(parent)
+            if not parents[parent]:
+                logger.warning(f"Parent directory does not exist: {parent}")
+        
+        if not parents[parent]:
+            results.append(False)
+        elif must_exist and not os.path.exists(path):
+            logger.error(f"Path does not exist: {path}")
+            results.append(False)
+        else:
+            results.append(True)
+    
+    return results
+
+
+# A window title substring/exact string, or a precompiled regex
+TitlePattern = Union[str, Pattern]
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_title(title_pattern: str, exact_match: bool) -> Pattern:
+    """
+    Compile (and memoize) the regex used to match a window title.
+    
+    Exact matches are case-sensitive; substring matches ignore case.
+    """
+    if exact_match:
+        return re.compile(re.escape(title_pattern))
+    return re.compile(re.escape(title_pattern), re.IGNORECASE)
+
+
+def _title_matcher(
+    title_pattern: TitlePattern,
+    exact_match: bool
+) -> Callable[[str], Optional[re.Match]]:
+    """
+    Return a callable that matches a window title against the pattern.
+    
+    Precompiled regexes are used as-is with .search (exact_match is ignored).
+    """
+    if isinstance(title_pattern, re.Pattern):
+        return title_pattern.search
+    
+    compiled = _compile_title(title_pattern, exact_match)
+    return compiled.fullmatch if exact_match else compiled.search
+
+
+def _pattern_text(title_pattern: TitlePattern) -> str:
+    """Human-readable form of a title pattern for log messages."""
+    return getattr(title_pattern, 'pattern', title_pattern)
+
+
+def _all_windows(fresh: bool = False) -> list:
+    """
+    All top-level windows, re-enumerated at most every WINDOW_LIST_TTL seconds.
+    
+    Args:
+        fresh: Enumerate now even if the cached list is recent
+    """
+    global _WINDOW_LIST, _WINDOW_LIST_TIME
+    now = time.monotonic()
+    if fresh or now - _WINDOW_LIST_TIME >= WINDOW_LIST_TTL:
+        _WINDOW_LIST = gw.getAllWindows()
+        _WINDOW_LIST_TIME = now
+    return _WINDOW_LIST
+
+
+def invalidate_window_cache():
+    """Force the next window lookup to re-enumerate (e.g. after closing windows)."""
+    global _WINDOW_LIST_TIME
+    _WINDOW_LIST_TIME = float('-inf')
+
+
+def _window_alive(window: gw.Win32Window) -> bool:
+    """Check that a (possibly cached) window handle still exists."""
+    return _user32 is None or bool(_user32.IsWindow(window._hWnd))
+
+
 def find_window_by_title(
-    title_pattern: str,
+    title_pattern: TitlePattern,
     exact_match: bool = False,
     timeout: float = 0
 ) -> Optional[gw.Win32Window]:
     """
     Find a window by title.
     
+    The active window is checked first, since the target is usually the one
+    that just opened; otherwise all windows are enumerated (the first pass
+    may reuse an enumeration up to WINDOW_LIST_TTL seconds old). With a
+    timeout on Windows, a missing window is awaited on a WinEvent hook and
+    then looked up again, polling for the rest of the timeout if that
+    lookup misses. Elsewhere (or if the hook can't be installed) polls back
+    off exponentially so long waits don't keep re-enumerating.
+    
     Args:
-        title_pattern: Window title or pattern to search for
+        title_pattern: Window title, or a compiled regex searched against each title
         exact_match: If True, require exact title match
         timeout: How long to wait for window (0 = don't wait)
     
     Returns:
         Window object if found, None otherwise
     """
-    import time
+    if timeout > 0 and _user32 is not None:
+        # Only install the hook if the window isn't there already
+        window = find_window_by_title(title_pattern, exact_match, timeout=0)
+        if window is not None:
+            return window
+        
+        start_time = time.time()
+        appeared = _wait_for_window_event(title_pattern, timeout, exact_match)
+        if appeared is False:
+            return None
+        
+        # Hook unavailable, or the lookup right after the event can still
+        # miss the window: poll for whatever time is left
+        invalidate_window_cache()
+        timeout = max(timeout - (time.time() - start_time), 0.0)
+    
     start_time = time.time()
+    matches = _title_matcher(title_pattern, exact_match)
+    iteration = 0
     
     while True:
         try:
-            all_windows = gw.getAllWindows()
+            active_window = gw.getActiveWindow()
+            if active_window is not None and matches(active_window.title):
+                logger.debug(f"Found active window: {active_window.title}")
+                return active_window
+            
+            all_windows = _all_windows(fresh=iteration > 0)
             
             for window in all_windows:
-                if exact_match:
-                    if window.title == title_pattern:
-                        logger.debug(f"Found window: {window.title}")
-                        return window
-                else:
-                    if title_pattern.lower() in window.title.lower():
-                        logger.debug(f"Found window: {window.title}")
-                        return window
+                if matches(window.title) and _window_alive(window):
+                    logger.debug(f"Found window: {window.title}")
+                    return window
             
             # Check timeout
-            if timeout <= 0 or (time.time() - start_time) >= timeout:
+            remaining = timeout - (time.time() - start_time)
+            if timeout <= 0 or remaining <= 0:
                 break
             
-            time.sleep(0.2)
+            interval = min(WINDOW_POLL_MAX, WINDOW_POLL_INITIAL * 2 ** iteration)
+            time.sleep(min(remaining, interval * random.uniform(0.5, 1.5)))
+            iteration += 1
             
         except Exception as e:
             logger.warning(f"Error finding window: {e}")
             break
     
-    logger.debug(f"Window not found: {title_pattern}")
+    logger.debug(f"Window not found: {_pattern_text(title_pattern)}")
     return None
 
 
+def _get_window_text(hwnd: int) -> str:
+    """Read a window title directly from user32."""
+    length = _user32.GetWindowTextLengthW(hwnd)
+    buffer = ctypes.create_unicode_buffer(length + 1)
+    _user32.GetWindowTextW(hwnd, buffer, length + 1)
+    return buffer.value
+
+
+def _wait_for_window_event(
+    title_pattern: TitlePattern,
+    timeout: float,
+    exact_match: bool = False
+) -> Optional[bool]:
+    """
+    Block until a matching window is created or shown, using SetWinEventHook.
+    
+    Args:
+        title_pattern: Window title pattern to wait for
+        timeout: Maximum time to wait in seconds
+        exact_match: Require exact title match
+    
+    Returns:
+        True if a matching window appeared, False on timeout,
+        None if the hook could not be installed (caller should poll instead)
+    """
+    matches = _title_matcher(title_pattern, exact_match)
+    appeared = threading.Event()
+    hook_ready = threading.Event()
+    state = {'hook': None, 'thread_id': None}
+    
+    def on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        # The hooked range also delivers EVENT_OBJECT_DESTROY; a closing
+        # window with a matching title must not count as appearing
+        if event == EVENT_OBJECT_DESTROY or id_object != OBJID_WINDOW or not hwnd:
+            return
+        
+        # EVENT_OBJECT_CREATE arrives before the window is shown, and the
+        # follow-up lookup (gw.getAllWindows) only sees visible windows
+        if not _user32.IsWindowVisible(hwnd):
+            return
+        
+        if matches(_get_window_text(hwnd)):
+            appeared.set()
+    
+    # Keep a reference so the callback isn't garbage collected while hooked
+    callback = WinEventProcType(on_event)
+    
+    def pump_messages():
+        state['thread_id'] = _kernel32.GetCurrentThreadId()
+        state['hook'] = _user32.SetWinEventHook(
+            EVENT_OBJECT_CREATE,
+            EVENT_OBJECT_SHOW,
+            0,
+            callback,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        )
+        hook_ready.set()
+        
+        if not state['hook']:
+            return
+        
+        msg = wintypes.MSG()
+        while _user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            _user32.TranslateMessage(ctypes.byref(msg))
+            _user32.DispatchMessageW(ctypes.byref(msg))
+        
+        _user32.UnhookWinEvent(wintypes.HANDLE(state['hook']))
+    
+    pump_thread = threading.Thread(target=pump_messages, daemon=True)
+    pump_thread.start()
+    hook_ready.wait()
+    
+    if not state['hook']:
+        logger.debug("SetWinEventHook failed, falling back to polling")
+        return None
+    
+    try:
+        # The window may already exist from before the hook was installed
+        invalidate_window_cache()
+        if find_window_by_title(title_pattern, exact_match, timeout=0):
+            return True
+        
+        return appeared.wait(timeout)
+    finally:
+        _user32.PostThreadMessageW(state['thread_id'], WM_QUIT, 0, 0)
+        pump_thread.join(timeout=1)
+
+
 def wait_for_window(
-    title_pattern: str,
+    title_pattern: TitlePattern,
     timeout: float = 5.0,
     exact_match: bool = False
 ) -> Optional[gw.Win32Window]:
     """
     Wait for a window to appear.
     
+    On Windows this blocks on a WinEvent hook instead of polling;
+    other platforms (or a failed hook install) fall back to polling.
+    
     Args:
-        title_pattern: Window title pattern to wait for
+        title_pattern: Window title pattern (or compiled regex) to wait for
         timeout: Maximum time to wait in seconds
         exact_match: Require exact title match
     
     Returns:
         Window object if found within timeout, None otherwise
     """
-    logger.info(f"Waiting for window: '{title_pattern}' (timeout: {timeout}s)")
+    logger.info(f"Waiting for window: '{_pattern_text(title_pattern)}' (timeout: {timeout}s)")
     
     window = find_window_by_title(title_pattern, exact_match, timeout)
     
@@ -136,19 +466,20 @@ def wait_for_window(
     return window
 
 
-def verify_window_active(title_pattern: str) -> bool:
+def verify_window_active(title_pattern: TitlePattern) -> bool:
     """
     Verify that a window with the given title is currently active.
     
     Args:
-        title_pattern: Window title pattern
+        title_pattern: Window title substring (case-insensitive) or compiled regex
     
     Returns:
         True if window is active
     """
+    matches = _title_matcher(title_pattern, exact_match=False)
     try:
         active_window = gw.getActiveWindow()
-        if active_window and title_pattern.lower() in active_window.title.lower():
+        if active_window and matches(active_window.title):
             logger.debug(f"Window is active: {active_window.title}")
             return True
         else:
@@ -163,12 +494,24 @@ def get_screen_size() -> Tuple[int, int]:
     """
     Get current screen size.
     
+    The OS is queried once and the result cached; call
+    invalidate_screen_size_cache() after a display change.
+    
     Returns:
         Tuple of (width, height)
     """
-    import pyautogui
-    size = pyautogui.size()
-    return size.width, size.height
+    global _SCREEN_SIZE
+    if _SCREEN_SIZE is None:
+        import pyautogui
+        size = pyautogui.size()
+        _SCREEN_SIZE = (size.width, size.height)
+    return _SCREEN_SIZE
+
+
+def invalidate_screen_size_cache():
+    """Forget the cached screen size (e.g. after a resolution change)."""
+    global _SCREEN_SIZE
+    _SCREEN_SIZE = None
 
 
 if __name__ == "__main__":